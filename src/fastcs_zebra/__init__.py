@@ -3,26 +3,16 @@
 This package provides asyncio-based serial communication with Diamond Light
 Source Zebra position compare and logic hardware.
 
-Phase 1 implementation includes:
+The package provides:
+
 - ZebraTransport: Low-level serial I/O
 - ZebraProtocol: Register read/write and command execution
 - InterruptHandler: Position compare data parsing
-
-Phase 2 implementation includes:
-- Complete register definitions (256 registers)
-- System bus signal mapping (64 signals)
-- Register type classification (RW, RO, CMD, MUX)
-- Bidirectional lookup (name ↔ address)
-- 32-bit register pair handling
-
-Phase 3 implementation includes:
-- Full controller hierarchy with sub-controllers
-- AND gates (AND1-4), OR gates (OR1-4)
-- Gate generators (GATE1-4)
-- Pulse generators (PULSE1-4)
-- Pulse dividers (DIV1-4)
-- Output routing (OUT1-8)
-- Position compare subsystem
+- PositionCompareBuffer: Compact columnar storage of captured data
+- Register definitions (256 registers), system bus signal mapping (64 signals)
+  and name/address lookup in ``fastcs_zebra.registers``
+- ZebraController: FastCS controller with sub-controllers for AND/OR gates,
+  gate and pulse generators, dividers, outputs and position compare
 
 Example usage::
 
@@ -46,78 +36,76 @@ Example usage::
     Version number as calculated by https://github.com/pypa/setuptools_scm
 """
 
+import importlib
+
 from ._version import __version__
-from .controllers import (
-    AndGateController,
-    DividerController,
-    GateController,
-    OrGateController,
-    OutputController,
-    PositionCompareController,
-    PulseController,
-)
-from .interrupts import InterruptHandler, PositionCompareData
-from .protocol import (
-    MalformedResponseError,
-    ProtocolError,
-    RegisterError,
-    ZebraProtocol,
-)
-from .register_io import ZebraRegisterIO, ZebraRegisterIORef
-from .registers import (
-    RegAddr,
-    Register,
-    Register32,
-    RegisterType,
-    SysBus,
-    get_all_registers,
-    get_all_registers_32bit,
-    get_register,
-    get_register_32bit,
-    is_command_register,
-    is_mux_register,
-    is_readonly_register,
-    signal_index_to_name,
-)
-from .transport import ZebraTransport
-from .zebra_controller import ZebraController
-
-__all__ = [
-    "__version__",
+
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access (PEP 562) so that e.g. ``--version`` does not pull in
+# the whole FastCS stack.
+_LAZY_IMPORTS = {
     # Transport and Protocol
-    "ZebraTransport",
-    "ZebraProtocol",
-    "ProtocolError",
-    "MalformedResponseError",
-    "RegisterError",
+    "ZebraTransport": "transport",
+    "ZebraProtocol": "protocol",
+    "ProtocolError": "protocol",
+    "MalformedResponseError": "protocol",
+    "RegisterError": "protocol",
     # Interrupts
-    "InterruptHandler",
-    "PositionCompareData",
+    "InterruptHandler": "interrupts",
+    "PositionCompareBuffer": "interrupts",
+    "PositionCompareData": "interrupts",
     # Controller
-    "ZebraController",
+    "ZebraController": "zebra_controller",
     # Sub-controllers
-    "AndGateController",
-    "OrGateController",
-    "GateController",
-    "PulseController",
-    "DividerController",
-    "OutputController",
-    "PositionCompareController",
+    "AndGateController": "controllers",
+    "OrGateController": "controllers",
+    "GateController": "controllers",
+    "PulseController": "controllers",
+    "DividerController": "controllers",
+    "OutputController": "controllers",
+    "PositionCompareController": "controllers",
     # Register IO
-    "ZebraRegisterIO",
-    "ZebraRegisterIORef",
+    "ZebraRegisterIO": "register_io",
+    "ZebraRegisterIORef": "register_io",
     # Register definitions
-    "Register",
-    "Register32",
-    "RegisterType",
-    "RegAddr",
-    "SysBus",
-    "get_register",
-    "get_register_32bit",
-    "get_all_registers",
-    "get_all_registers_32bit",
-    "is_mux_register",
-    "is_readonly_register",
-    "is_command_register",
-    "signal_index_to_name",
-]
+    "Register": "registers",
+    "Register32": "registers",
+    "RegisterType": "registers",
+    "RegAddr": "registers",
+    "SysBus": "registers",
+    "get_register": "registers",
+    "get_register_by_name": "registers",
+    "get_register_by_address": "registers",
+    "get_register_32bit": "registers",
+    "get_all_registers": "registers",
+    "get_all_registers_32bit": "registers",
+    "is_mux_register": "registers",
+    "is_readonly_register": "registers",
+    "is_command_register": "registers",
+    "mux_write_pair": "registers",
+    "decode_sys_stat": "registers",
+    "signal_index_to_name": "registers",
+    "signal_indices_to_names": "registers",
+    "signal_name_to_index": "registers",
+}
+
+
+def __getattr__(name: str):
+    """Import public names from their submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Derived so the lazy imports and the public API cannot drift apart
+__all__ = ["__version__", *_LAZY_IMPORTS]  # pyright: ignore[reportUnsupportedDunderAll]
@@ -0,0 +1,26 @@
+"""Datatype instances shared by controller attributes.
+
+Datatypes are immutable, so one instance of each is shared by every
+attribute rather than each controller module creating its own.
+"""
+
+from fastcs.datatypes import Bool, Enum, Int, String
+
+from fastcs_zebra.controllers.enums import (
+    ArmSelection,
+    Direction,
+    EncoderSelection,
+    Prescaler,
+    SourceSelection,
+)
+from fastcs_zebra.registers import SysBus
+
+BOOL = Bool()
+INT = Int()
+STRING = String()
+ENUM_SYSBUS = Enum(SysBus)
+ENUM_ENCODER = Enum(EncoderSelection)
+ENUM_PRESCALER = Enum(Prescaler)
+ENUM_DIRECTION = Enum(Direction)
+ENUM_ARM_SEL = Enum(ArmSelection)
+ENUM_SOURCE_SEL = Enum(SourceSelection)
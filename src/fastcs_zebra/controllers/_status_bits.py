@@ -0,0 +1,48 @@
+"""System bus status word helpers.
+
+The parent controller reads SYS_STAT1/2 and packs them into one 64-bit
+status word, where bit N is system bus signal N. Each poll it updates the
+attributes on the bits that changed since the previous word.
+"""
+
+from collections.abc import Iterator
+
+from fastcs_zebra.registers import SysBus
+
+# Every bit of the packed status
+ALL_STATUS_BITS = (1 << len(SysBus)) - 1
+
+
+def pack_status(sys_stat1: int, sys_stat2: int) -> int:
+    """Pack the two 32-bit system bus status words into one 64-bit word.
+
+    Args:
+        sys_stat1: System bus status for signals 0-31
+        sys_stat2: System bus status for signals 32-63
+
+    Returns:
+        Packed status (bit N is signal N)
+    """
+    return sys_stat1 | (sys_stat2 << 32)
+
+
+def set_bit_indices(word: int) -> Iterator[int]:
+    """Yield the index of each set bit in a status word, lowest first.
+
+    Cost is proportional to the number of set bits rather than the word
+    width, so walking the XOR of two successive status words visits only the
+    signals that changed.
+
+    Args:
+        word: Packed status, or a mask of changed bits
+
+    Yields:
+        Bit (signal) indices
+
+    >>> list(set_bit_indices(0b100101))
+    [0, 2, 5]
+    """
+    while word:
+        lowest = word & -word
+        yield lowest.bit_length() - 1
+        word ^= lowest
@@ -9,12 +9,18 @@ Each pulse divider:
 """
 
 from fastcs.attributes import AttrR
-from fastcs.datatypes import Bool, Enum, Int
 
+from fastcs_zebra.controllers._datatypes import BOOL, ENUM_SYSBUS, INT
 from fastcs_zebra.controllers.sub_controller import ZebraSubcontroller
 from fastcs_zebra.register_io import ZebraRegisterIO
 from fastcs_zebra.registers import SysBus
 
+# Per-divider lookups (output signal indices as plain ints), by div_num - 1
+_DIV_SYSBUS = tuple(
+    (SysBus[f"DIV{n}_OUTD"].value, SysBus[f"DIV{n}_OUTN"].value) for n in range(1, 5)
+)
+_DIV_REG_NAMES = tuple((f"DIV{n}_INP", f"DIV{n}_DIV") for n in range(1, 5))
+
 
 class DividerController(ZebraSubcontroller):
     """Controller for a single pulse divider (DIV1-DIV4).
@@ -46,12 +52,16 @@ class DividerController(ZebraSubcontroller):
         super().__init__(div_num, register_io)
 
         # System bus indices for this divider's outputs
-        self._sysbus_outd = getattr(SysBus, f"DIV{div_num}_OUTD")
-        self._sysbus_outn = getattr(SysBus, f"DIV{div_num}_OUTN")
+        self._sysbus_outd, self._sysbus_outn = _DIV_SYSBUS[div_num - 1]
+        inp_name, div_name = _DIV_REG_NAMES[div_num - 1]
 
-        self.inp = self.make_register(f"DIV{div_num}_INP", Enum(SysBus))
-        self.div = self.make_register32(f"DIV{div_num}_DIV", Int())
+        self.inp = self.make_register(inp_name, ENUM_SYSBUS)
+        self.div = self.make_register32(div_name, INT)
 
         # Output states (from system bus status)
-        self.outd = AttrR(Bool())  # Divided output
-        self.outn = AttrR(Bool())  # Non-divided (passthrough) output
+        self.outd = AttrR(BOOL)  # Divided output
+        self.outn = AttrR(BOOL)  # Non-divided (passthrough) output
+        self.status_outputs = (
+            (self._sysbus_outd, self.outd),
+            (self._sysbus_outn, self.outn),
+        )
@@ -10,12 +10,16 @@ based on external signals.
 """
 
 from fastcs.attributes import AttrR
-from fastcs.datatypes import Bool, Enum
 
+from fastcs_zebra.controllers._datatypes import BOOL, ENUM_SYSBUS
 from fastcs_zebra.controllers.sub_controller import ZebraSubcontroller
 from fastcs_zebra.register_io import ZebraRegisterIO
 from fastcs_zebra.registers import SysBus
 
+# Per-gate lookups (output signal indices as plain ints), by gate_num - 1
+_GATE_SYSBUS = tuple(SysBus[f"GATE{n}"].value for n in range(1, 5))
+_GATE_REG_NAMES = tuple((f"GATE{n}_INP1", f"GATE{n}_INP2") for n in range(1, 5))
+
 
 class GateController(ZebraSubcontroller):
     """Controller for a single gate generator (GATE1-GATE4).
@@ -49,11 +53,13 @@ class GateController(ZebraSubcontroller):
         """
         super().__init__(gate_num, register_io)
 
-        self.inp1 = self.make_register(f"GATE{gate_num}_INP1", Enum(SysBus))
-        self.inp2 = self.make_register(f"GATE{gate_num}_INP2", Enum(SysBus))
+        inp1_name, inp2_name = _GATE_REG_NAMES[gate_num - 1]
+        self.inp1 = self.make_register(inp1_name, ENUM_SYSBUS)
+        self.inp2 = self.make_register(inp2_name, ENUM_SYSBUS)
 
         # System bus index for this gate's output
-        self._sysbus_index = getattr(SysBus, f"GATE{gate_num}")
+        self._sysbus_index = _GATE_SYSBUS[gate_num - 1]
 
         # Output state (from system bus status)
-        self.out = AttrR(Bool())
+        self.out = AttrR(BOOL)
+        self.status_outputs = ((self._sysbus_index, self.out),)
@@ -11,12 +11,29 @@ or other gates.
 """
 
 from fastcs.attributes import AttrR
-from fastcs.datatypes import Bool, Enum, Int
 
+from fastcs_zebra.controllers._datatypes import BOOL, ENUM_SYSBUS, INT
 from fastcs_zebra.controllers.sub_controller import ZebraSubcontroller
 from fastcs_zebra.register_io import ZebraRegisterIO
 from fastcs_zebra.registers import SysBus
 
+# Register name suffixes for each gate, in the order they are unpacked
+_REG_SUFFIXES = ("INV", "ENA", "INP1", "INP2", "INP3", "INP4")
+
+
+def _gate_reg_names(prefix: str) -> tuple[tuple[str, ...], ...]:
+    """Build register names for each gate of one type, indexed by gate_num - 1."""
+    return tuple(
+        tuple(f"{prefix}{n}_{suffix}" for suffix in _REG_SUFFIXES) for n in range(1, 5)
+    )
+
+
+# Per-gate lookups (output signal indices as plain ints), by gate_num - 1
+_AND_SYSBUS = tuple(SysBus[f"AND{n}"].value for n in range(1, 5))
+_AND_REG_NAMES = _gate_reg_names("AND")
+_OR_SYSBUS = tuple(SysBus[f"OR{n}"].value for n in range(1, 5))
+_OR_REG_NAMES = _gate_reg_names("OR")
+
 
 class AndGateController(ZebraSubcontroller):
     """Controller for a single AND gate (AND1-AND4).
@@ -49,18 +66,20 @@ class AndGateController(ZebraSubcontroller):
         """
         super().__init__(gate_num, register_io)
 
-        self.inv = self.make_register(f"AND{gate_num}_INV", Int())
-        self.ena = self.make_register(f"AND{gate_num}_ENA", Int())
-        self.inp1 = self.make_register(f"AND{gate_num}_INP1", Enum(SysBus))
-        self.inp2 = self.make_register(f"AND{gate_num}_INP2", Enum(SysBus))
-        self.inp3 = self.make_register(f"AND{gate_num}_INP3", Enum(SysBus))
-        self.inp4 = self.make_register(f"AND{gate_num}_INP4", Enum(SysBus))
+        inv, ena, inp1, inp2, inp3, inp4 = _AND_REG_NAMES[gate_num - 1]
+        self.inv = self.make_register(inv, INT)
+        self.ena = self.make_register(ena, INT)
+        self.inp1 = self.make_register(inp1, ENUM_SYSBUS)
+        self.inp2 = self.make_register(inp2, ENUM_SYSBUS)
+        self.inp3 = self.make_register(inp3, ENUM_SYSBUS)
+        self.inp4 = self.make_register(inp4, ENUM_SYSBUS)
 
         # System bus index for this gate's output
-        self._sysbus_index = getattr(SysBus, f"AND{gate_num}")
+        self._sysbus_index = _AND_SYSBUS[gate_num - 1]
 
         # Output state (from system bus status)
-        self.out = AttrR(Bool())
+        self.out = AttrR(BOOL)
+        self.status_outputs = ((self._sysbus_index, self.out),)
 
 
 class OrGateController(ZebraSubcontroller):
@@ -94,15 +113,17 @@ class OrGateController(ZebraSubcontroller):
         """
         super().__init__(gate_num, register_io)
 
-        self.inv = self.make_register(f"OR{gate_num}_INV", Int())
-        self.ena = self.make_register(f"OR{gate_num}_ENA", Int())
-        self.inp1 = self.make_register(f"OR{gate_num}_INP1", Enum(SysBus))
-        self.inp2 = self.make_register(f"OR{gate_num}_INP2", Enum(SysBus))
-        self.inp3 = self.make_register(f"OR{gate_num}_INP3", Enum(SysBus))
-        self.inp4 = self.make_register(f"OR{gate_num}_INP4", Enum(SysBus))
+        inv, ena, inp1, inp2, inp3, inp4 = _OR_REG_NAMES[gate_num - 1]
+        self.inv = self.make_register(inv, INT)
+        self.ena = self.make_register(ena, INT)
+        self.inp1 = self.make_register(inp1, ENUM_SYSBUS)
+        self.inp2 = self.make_register(inp2, ENUM_SYSBUS)
+        self.inp3 = self.make_register(inp3, ENUM_SYSBUS)
+        self.inp4 = self.make_register(inp4, ENUM_SYSBUS)
 
         # System bus index for this gate's output
-        self._sysbus_index = getattr(SysBus, f"OR{gate_num}")
+        self._sysbus_index = _OR_SYSBUS[gate_num - 1]
 
         # Output state (from system bus status)
-        self.out = AttrR(Bool())
+        self.out = AttrR(BOOL)
+        self.status_outputs = ((self._sysbus_index, self.out),)
@@ -9,11 +9,29 @@ The Zebra has 8 output connectors with different signal types:
 Each output type can be independently routed to any of the 64 system bus signals.
 """
 
-from fastcs.datatypes import Enum
-
+from fastcs_zebra.controllers._datatypes import ENUM_SYSBUS
 from fastcs_zebra.controllers.sub_controller import ZebraSubcontroller
 from fastcs_zebra.register_io import ZebraRegisterIO
-from fastcs_zebra.registers import SysBus
+
+# Signal types for each output number
+_OUTPUT_TYPES = {
+    1: ["ttl", "nim", "lvds"],
+    2: ["ttl", "nim", "lvds"],
+    3: ["ttl", "oc", "lvds"],
+    4: ["ttl", "nim", "pecl"],
+    5: ["enca", "encb", "encz", "conn"],
+    6: ["enca", "encb", "encz", "conn"],
+    7: ["enca", "encb", "encz", "conn"],
+    8: ["enca", "encb", "encz", "conn"],
+}
+
+# (signal type, register name) pairs for each output number
+_OUT_REG_NAMES = {
+    out_num: tuple(
+        (sig_type, f"OUT{out_num}_{sig_type.upper()}") for sig_type in sig_types
+    )
+    for out_num, sig_types in _OUTPUT_TYPES.items()
+}
 
 
 class OutputController(ZebraSubcontroller):
@@ -31,16 +49,7 @@ class OutputController(ZebraSubcontroller):
     """
 
     # Define the signal types for each output
-    OUTPUT_TYPES = {
-        1: ["ttl", "nim", "lvds"],
-        2: ["ttl", "nim", "lvds"],
-        3: ["ttl", "oc", "lvds"],
-        4: ["ttl", "nim", "pecl"],
-        5: ["enca", "encb", "encz", "conn"],
-        6: ["enca", "encb", "encz", "conn"],
-        7: ["enca", "encb", "encz", "conn"],
-        8: ["enca", "encb", "encz", "conn"],
-    }
+    OUTPUT_TYPES = _OUTPUT_TYPES
 
     count = 8  # Number of outputs available
 
@@ -60,7 +69,6 @@ class OutputController(ZebraSubcontroller):
         self._signal_types = self.OUTPUT_TYPES[out_num]
 
         # Create attributes for each signal type
-        for sig_type in self._signal_types:
-            reg_name = f"OUT{out_num}_{sig_type.upper()}"
-            attr = self.make_register(reg_name, Enum(SysBus))
+        for sig_type, reg_name in _OUT_REG_NAMES[out_num]:
+            attr = self.make_register(reg_name, ENUM_SYSBUS)
             setattr(self, sig_type, attr)
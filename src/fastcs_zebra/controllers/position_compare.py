@@ -15,16 +15,18 @@ arm/disarm, configuration, and interrupt-driven data updates.
 from typing import TYPE_CHECKING
 
 from fastcs.attributes import AttrR
-from fastcs.datatypes import Bool, Enum, Int
 
 if TYPE_CHECKING:
     from fastcs_zebra.interrupts import InterruptHandler
-from fastcs_zebra.controllers.enums import (
-    ArmSelection,
-    Direction,
-    EncoderSelection,
-    Prescaler,
-    SourceSelection,
+from fastcs_zebra.controllers._datatypes import (
+    BOOL,
+    ENUM_ARM_SEL,
+    ENUM_DIRECTION,
+    ENUM_ENCODER,
+    ENUM_PRESCALER,
+    ENUM_SOURCE_SEL,
+    ENUM_SYSBUS,
+    INT,
 )
 from fastcs_zebra.controllers.sub_controller import ZebraSubcontroller
 from fastcs_zebra.register_io import ZebraRegisterIO
@@ -108,60 +110,66 @@ class PositionCompareController(ZebraSubcontroller):
         # =====================================================================
         # Encoder and Timing Selection
         # =====================================================================
-        self.enc = self.make_register("PC_ENC", Enum(EncoderSelection))
-        self.tspre = self.make_register("PC_TSPRE", Enum(Prescaler))
-        self.dir = self.make_register("PC_DIR", Enum(Direction))
+        self.enc = self.make_register("PC_ENC", ENUM_ENCODER)
+        self.tspre = self.make_register("PC_TSPRE", ENUM_PRESCALER)
+        self.dir = self.make_register("PC_DIR", ENUM_DIRECTION)
 
         # =====================================================================
         # Arm Configuration
         # =====================================================================
-        self.arm_sel = self.make_register("PC_ARM_SEL", Enum(ArmSelection))
-        self.arm_inp = self.make_register("PC_ARM_INP", Enum(SysBus))
+        self.arm_sel = self.make_register("PC_ARM_SEL", ENUM_ARM_SEL)
+        self.arm_inp = self.make_register("PC_ARM_INP", ENUM_SYSBUS)
 
-        self.arm_out = AttrR(Bool())
+        self.arm_out = AttrR(BOOL)
 
         # =====================================================================
         # Gate Configuration
         # =====================================================================
-        self.gate_sel = self.make_register("PC_GATE_SEL", Enum(SourceSelection))
-        self.gate_inp = self.make_register("PC_GATE_INP", Enum(SysBus))
+        self.gate_sel = self.make_register("PC_GATE_SEL", ENUM_SOURCE_SEL)
+        self.gate_inp = self.make_register("PC_GATE_INP", ENUM_SYSBUS)
 
-        self.gate_start = self.make_register32("PC_GATE_START", Int())
-        self.gate_wid = self.make_register32("PC_GATE_WID", Int())
-        self.gate_ngate = self.make_register32("PC_GATE_NGATE", Int())
-        self.gate_step = self.make_register32("PC_GATE_STEP", Int())
+        self.gate_start = self.make_register32("PC_GATE_START", INT)
+        self.gate_wid = self.make_register32("PC_GATE_WID", INT)
+        self.gate_ngate = self.make_register32("PC_GATE_NGATE", INT)
+        self.gate_step = self.make_register32("PC_GATE_STEP", INT)
 
-        self.gate_out = AttrR(Bool())
+        self.gate_out = AttrR(BOOL)
 
         # =====================================================================
         # Pulse Configuration
         # =====================================================================
-        self.pulse_sel = self.make_register("PC_PULSE_SEL", Enum(SourceSelection))
-        self.pulse_inp = self.make_register("PC_PULSE_INP", Enum(SysBus))
+        self.pulse_sel = self.make_register("PC_PULSE_SEL", ENUM_SOURCE_SEL)
+        self.pulse_inp = self.make_register("PC_PULSE_INP", ENUM_SYSBUS)
 
-        self.pulse_start = self.make_register32("PC_PULSE_START", Int())
-        self.pulse_wid = self.make_register32("PC_PULSE_WID", Int())
-        self.pulse_step = self.make_register32("PC_PULSE_STEP", Int())
-        self.pulse_max = self.make_register32("PC_PULSE_MAX", Int())
-        self.pulse_dly = self.make_register32("PC_PULSE_DLY", Int())
+        self.pulse_start = self.make_register32("PC_PULSE_START", INT)
+        self.pulse_wid = self.make_register32("PC_PULSE_WID", INT)
+        self.pulse_step = self.make_register32("PC_PULSE_STEP", INT)
+        self.pulse_max = self.make_register32("PC_PULSE_MAX", INT)
+        self.pulse_dly = self.make_register32("PC_PULSE_DLY", INT)
 
-        self.pulse_out = AttrR(Bool())
+        self.pulse_out = AttrR(BOOL)
+
+        self.status_outputs = (
+            (SysBus.PC_ARM.value, self.arm_out),
+            (SysBus.PC_GATE.value, self.gate_out),
+            (SysBus.PC_PULSE.value, self.pulse_out),
+        )
 
         # =====================================================================
         # Capture Configuration and Status
         # =====================================================================
-        self.bit_cap = self.make_register("PC_BIT_CAP", Int())
+        self.bit_cap = self.make_register("PC_BIT_CAP", INT)
 
-        self.num_cap = self.make_register32("PC_NUM_CAP", Int())
+        self.num_cap = self.make_register32("PC_NUM_CAP", INT)
 
         # =====================================================================
         # Last Captured Values (updated by interrupts, no IO)
         # =====================================================================
-        self.time_last = AttrR(Int())
-        self.enc1_last = AttrR(Int())
-        self.enc2_last = AttrR(Int())
-        self.enc3_last = AttrR(Int())
-        self.enc4_last = AttrR(Int())
+        self.time_last = AttrR(INT)
+        self.enc1_last = AttrR(INT)
+        self.enc2_last = AttrR(INT)
+        self.enc3_last = AttrR(INT)
+        self.enc4_last = AttrR(INT)
 
     def register_interrupt_handler(self, handler: "InterruptHandler") -> None:
         """Register interrupt handler to receive bit_cap updates.
@@ -173,12 +181,13 @@ class PositionCompareController(ZebraSubcontroller):
         Args:
             handler: The interrupt handler to notify of bit_cap changes
         """
+        if self._interrupt_handler is None:
+            # Only add the callback once, later calls just swap the handler
+            self.bit_cap.add_on_update_callback(self._on_bit_cap_update)
         self._interrupt_handler = handler
 
-        # Set up callback to update interrupt handler when bit_cap changes
-        async def on_bit_cap_update(value: int | None) -> None:
-            """Update interrupt handler when PC_BIT_CAP changes."""
-            if value is not None and self._interrupt_handler is not None:
-                self._interrupt_handler.set_bit_cap(value)
-
-        self.bit_cap.add_on_update_callback(on_bit_cap_update)
+    async def _on_bit_cap_update(self, value: int | None) -> None:
+        """Update interrupt handler when PC_BIT_CAP changes."""
+        handler = self._interrupt_handler
+        if value is not None and handler is not None:
+            handler.set_bit_cap(value)
@@ -11,13 +11,19 @@ or other logic.
 """
 
 from fastcs.attributes import AttrR
-from fastcs.datatypes import Bool, Enum, Int
 
-from fastcs_zebra.controllers.enums import Prescaler
+from fastcs_zebra.controllers._datatypes import BOOL, ENUM_PRESCALER, ENUM_SYSBUS, INT
 from fastcs_zebra.controllers.sub_controller import ZebraSubcontroller
 from fastcs_zebra.register_io import ZebraRegisterIO
 from fastcs_zebra.registers import SysBus
 
+# Per-pulse lookups (output signal indices as plain ints), by pulse_num - 1
+_PULSE_SYSBUS = tuple(SysBus[f"PULSE{n}"].value for n in range(1, 5))
+_PULSE_REG_NAMES = tuple(
+    (f"PULSE{n}_INP", f"PULSE{n}_DLY", f"PULSE{n}_WID", f"PULSE{n}_PRE")
+    for n in range(1, 5)
+)
+
 
 class PulseController(ZebraSubcontroller):
     """Controller for a single pulse generator (PULSE1-PULSE4).
@@ -53,13 +59,15 @@ class PulseController(ZebraSubcontroller):
         """
         super().__init__(pulse_num, register_io)
 
-        self.inp = self.make_register(f"PULSE{pulse_num}_INP", Enum(SysBus))
-        self.dly = self.make_register(f"PULSE{pulse_num}_DLY", Int())
-        self.wid = self.make_register(f"PULSE{pulse_num}_WID", Int())
-        self.pre = self.make_register(f"PULSE{pulse_num}_PRE", Enum(Prescaler))
+        inp_name, dly_name, wid_name, pre_name = _PULSE_REG_NAMES[pulse_num - 1]
+        self.inp = self.make_register(inp_name, ENUM_SYSBUS)
+        self.dly = self.make_register(dly_name, INT)
+        self.wid = self.make_register(wid_name, INT)
+        self.pre = self.make_register(pre_name, ENUM_PRESCALER)
 
         # System bus index for this pulse generator's output
-        self._sysbus_index = getattr(SysBus, f"PULSE{pulse_num}")
+        self._sysbus_index = _PULSE_SYSBUS[pulse_num - 1]
 
         # Output state (from system bus status)
-        self.out = AttrR(Bool())
+        self.out = AttrR(BOOL)
+        self.status_outputs = ((self._sysbus_index, self.out),)
@@ -2,7 +2,9 @@
 A base class for all Zebra Subcontrollers.
 """
 
-from fastcs.attributes import AttrRW
+from functools import cache
+
+from fastcs.attributes import AttrR, AttrRW
 from fastcs.controllers import Controller
 from fastcs.util import ONCE
 
@@ -15,7 +17,9 @@ class ZebraSubcontroller(Controller):
 
     count = 0  # Number of subcontrollers available (override in subclasses)
 
-    all_controllers: list["ZebraSubcontroller"] = []  # List of all subcontrollers
+    # (system bus index, attribute) for each output state that follows a
+    # system bus signal (set in subclasses)
+    status_outputs: tuple[tuple[int, AttrR], ...] = ()
 
     def __init__(
         self,
@@ -33,8 +37,6 @@ class ZebraSubcontroller(Controller):
         if not 1 <= num <= self.count:
             raise ValueError(f"number must be 1-{self.count}, got {num}")
 
-        self.all_controllers.append(self)
-
         self._num = num
         self._register_io = register_io
 
@@ -45,8 +47,7 @@ class ZebraSubcontroller(Controller):
         update_period: float = ONCE,
     ) -> AttrRW:
         """Helper to create a read-write attribute with for a register"""
-        addr = REGISTERS_BY_NAME[register_name].address
-        io_ref = ZebraRegisterIORef(update_period=update_period, register=addr)
+        io_ref = _register_io_ref(register_name, update_period)
         attr = AttrRW(datatype=dtype, io_ref=io_ref)
         return attr
 
@@ -57,12 +58,24 @@ class ZebraSubcontroller(Controller):
         update_period: float = ONCE,
     ) -> AttrRW:
         """Helper to create a read-write attribute with for a register"""
-        reg32 = REGISTERS_32BIT_BY_NAME[register_name]
-        io_ref = ZebraRegisterIORef(
-            update_period=update_period,
-            register=reg32.address_lo,
-            is_32bit=True,
-            register_hi=reg32.address_hi,
-        )
+        io_ref = _register32_io_ref(register_name, update_period)
         attr = AttrRW(datatype=dtype, io_ref=io_ref)
         return attr
+
+
+# Register name lookups are resolved once per name, not once per controller
+@cache
+def _register_io_ref(register_name: str, update_period: float) -> ZebraRegisterIORef:
+    addr = REGISTERS_BY_NAME[register_name].address
+    return ZebraRegisterIORef.get(addr, update_period=update_period)
+
+
+@cache
+def _register32_io_ref(register_name: str, update_period: float) -> ZebraRegisterIORef:
+    reg32 = REGISTERS_32BIT_BY_NAME[register_name]
+    return ZebraRegisterIORef.get(
+        reg32.address_lo,
+        is_32bit=True,
+        register_hi=reg32.address_hi,
+        update_period=update_period,
+    )
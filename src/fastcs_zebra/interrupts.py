@@ -20,15 +20,31 @@ The number and meaning of data fields depends on PC_BIT_CAP register:
 - Bit 9: Divider 4 count (unsigned 32-bit)
 """
 
+import asyncio
 import logging
-import re
-from collections.abc import Awaitable, Callable
+import struct
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# PC_BIT_CAP field mapping: (bit, field_name, is_signed)
+_FIELD_MAP: tuple[tuple[int, str, bool], ...] = (
+    (0, "encoder1", True),
+    (1, "encoder2", True),
+    (2, "encoder3", True),
+    (3, "encoder4", True),
+    (4, "sysbus1", False),
+    (5, "sysbus2", False),
+    (6, "div1", False),
+    (7, "div2", False),
+    (8, "div3", False),
+    (9, "div4", False),
+)
+
+
+@dataclass(slots=True)
 class PositionCompareData:
     """Position compare capture data point.
 
@@ -49,6 +65,93 @@ class PositionCompareData:
     div4: int | None = None
 
 
+class PositionCompareBuffer:
+    """Columnar store for the data points of a position compare acquisition.
+
+    Keeps one compact 32-bit ``array`` per field instead of one
+    PositionCompareData object per point, so long captures use a fraction
+    of the memory and columns can be handed to numeric code directly.
+
+    Attach to an InterruptHandler to fill it automatically: the buffer is
+    cleared on PR and a row is appended for each data point. Columns for
+    fields not enabled in PC_BIT_CAP stay empty.
+
+    Attributes:
+        timestamp: Timestamp counter (unsigned)
+        encoder1-4: Encoder counts (signed)
+        sysbus1-2: System bus states (unsigned)
+        div1-4: Divider counts (unsigned)
+    """
+
+    # Columns are created in __init__; declared here for type checkers
+    timestamp: "array[int]"
+    encoder1: "array[int]"
+    encoder2: "array[int]"
+    encoder3: "array[int]"
+    encoder4: "array[int]"
+    sysbus1: "array[int]"
+    sysbus2: "array[int]"
+    div1: "array[int]"
+    div2: "array[int]"
+    div3: "array[int]"
+    div4: "array[int]"
+
+    # (field name, array typecode) - "i"/"I" are 32-bit on supported platforms
+    _COLUMNS = (
+        ("timestamp", "I"),
+        ("encoder1", "i"),
+        ("encoder2", "i"),
+        ("encoder3", "i"),
+        ("encoder4", "i"),
+        ("sysbus1", "I"),
+        ("sysbus2", "I"),
+        ("div1", "I"),
+        ("div2", "I"),
+        ("div3", "I"),
+        ("div4", "I"),
+    )
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        for name, typecode in self._COLUMNS:
+            setattr(self, name, array(typecode))
+
+    def __len__(self) -> int:
+        """Number of data points stored."""
+        return len(self.timestamp)
+
+    def append(self, data: PositionCompareData) -> None:
+        """Append a data point.
+
+        Args:
+            data: Parsed data point
+        """
+        for name, _ in self._COLUMNS:
+            value = getattr(data, name)
+            if value is not None:
+                getattr(self, name).append(value)
+
+    def clear(self) -> None:
+        """Remove all data points."""
+        for name, typecode in self._COLUMNS:
+            setattr(self, name, array(typecode))
+
+    def attach(self, handler: "InterruptHandler") -> None:
+        """Fill this buffer from an interrupt handler's callbacks.
+
+        Args:
+            handler: Handler whose reset and data events should be recorded
+        """
+
+        @handler.on_reset
+        async def on_reset():
+            self.clear()
+
+        @handler.on_data
+        async def on_data(data: PositionCompareData):
+            self.append(data)
+
+
 class InterruptHandler:
     """Handles asynchronous interrupt messages from Zebra.
 
@@ -56,23 +159,32 @@ class InterruptHandler:
     and dispatches to registered callbacks.
     """
 
-    # Interrupt message patterns
-    RESET_PATTERN = re.compile(r"^PR$")
-    END_PATTERN = re.compile(r"^PX$")
-    DATA_PATTERN = re.compile(r"^P([0-9A-F]{8})(.*)$")
-
     def __init__(self, bit_cap: int = 0):
         """Initialize interrupt handler.
 
         Args:
             bit_cap: PC_BIT_CAP register value (which fields are captured)
         """
-        self.bit_cap = bit_cap
-        self._reset_callbacks: list[Callable[[], Awaitable[None]]] = []
-        self._data_callbacks: list[
-            Callable[[PositionCompareData], Awaitable[None]]
-        ] = []
-        self._end_callbacks: list[Callable[[], Awaitable[None]]] = []
+        self.bit_cap = bit_cap  # Also computes the data field layout
+        # Tuples, rebuilt on registration, as they are iterated far more often
+        self._reset_callbacks: tuple[Callable[[], Awaitable[None]], ...] = ()
+        self._data_callbacks: tuple[
+            Callable[[PositionCompareData], Awaitable[None]], ...
+        ] = ()
+        self._end_callbacks: tuple[Callable[[], Awaitable[None]], ...] = ()
+
+    @property
+    def bit_cap(self) -> int:
+        """PC_BIT_CAP register value (which fields are captured)."""
+        return self._bit_cap
+
+    @bit_cap.setter
+    def bit_cap(self, bit_cap: int) -> None:
+        self._bit_cap = bit_cap
+        self._field_names, self._fields_struct = self._field_layout(bit_cap)
+        # Timestamp followed by the fields, for decoding whole messages
+        self._message_struct = struct.Struct(">I" + self._fields_struct.format[1:])
+        self._expected_len = self._fields_struct.size * 2  # Two hex chars a byte
 
     def set_bit_cap(self, bit_cap: int) -> None:
         """Update PC_BIT_CAP configuration.
@@ -81,16 +193,42 @@ class InterruptHandler:
             bit_cap: New PC_BIT_CAP register value
         """
         self.bit_cap = bit_cap
-        logger.debug(f"Updated PC_BIT_CAP to {bit_cap:#06x}")
+        logger.debug("Updated PC_BIT_CAP to %#06x", bit_cap)
+
+    @staticmethod
+    def _field_layout(bit_cap: int) -> tuple[tuple[str, ...], struct.Struct]:
+        """Work out how to unpack the captured fields of a data message.
+
+        PC_BIT_CAP changes rarely, so this runs when it is set rather than
+        for every data message.
+
+        Args:
+            bit_cap: PC_BIT_CAP register value
+
+        Returns:
+            Names of the enabled fields in message order, and a Struct that
+            unpacks their values from the decoded field bytes
+        """
+        # Each enabled bit adds a big-endian 32-bit field, in order of bit
+        # position. Bits with no field are skipped over.
+        names = []
+        fmt = ">"
+        for bit, field_name, is_signed in _FIELD_MAP:
+            if bit_cap & (1 << bit):
+                names.append(field_name)
+                fmt += "i" if is_signed else "I"
+        num_unknown = bit_cap.bit_count() - len(names)
+        fmt += "4x" * num_unknown
+        return tuple(names), struct.Struct(fmt)
 
     def clear_callbacks(self) -> None:
         """Remove all registered callbacks.
 
         Useful for testing or when re-initializing the handler.
         """
-        self._reset_callbacks.clear()
-        self._data_callbacks.clear()
-        self._end_callbacks.clear()
+        self._reset_callbacks = ()
+        self._data_callbacks = ()
+        self._end_callbacks = ()
 
     def on_reset(
         self, callback: Callable[[], Awaitable[None]]
@@ -103,7 +241,7 @@ class InterruptHandler:
         Returns:
             The callback (for use as decorator)
         """
-        self._reset_callbacks.append(callback)
+        self._reset_callbacks += (callback,)
         return callback
 
     def on_data(
@@ -117,7 +255,7 @@ class InterruptHandler:
         Returns:
             The callback (for use as decorator)
         """
-        self._data_callbacks.append(callback)
+        self._data_callbacks += (callback,)
         return callback
 
     def on_end(
@@ -131,7 +269,7 @@ class InterruptHandler:
         Returns:
             The callback (for use as decorator)
         """
-        self._end_callbacks.append(callback)
+        self._end_callbacks += (callback,)
         return callback
 
     async def handle_message(self, message: str) -> bool:
@@ -150,32 +288,130 @@ class InterruptHandler:
             return False  # Not an interrupt
 
         # Check for reset message
-        if self.RESET_PATTERN.match(message):
+        if message == "PR":
             logger.debug("Position compare reset (PR)")
             await self._dispatch_reset()
             return True
 
         # Check for end message
-        if self.END_PATTERN.match(message):
+        if message == "PX":
             logger.debug("Position compare complete (PX)")
             await self._dispatch_end()
             return True
 
-        # Parse data message
-        match = self.DATA_PATTERN.match(message)
-        if not match:
-            raise ValueError(f"Invalid interrupt message format: {message!r}")
-
-        timestamp_str, data_str = match.groups()
-        timestamp = int(timestamp_str, 16)
+        # Parse data message: P<TTTTTTTT><fields>. isalnum() rejects the
+        # sign, underscore and whitespace that int() would otherwise accept.
+        timestamp_str = message[1:9]
+        try:
+            if len(timestamp_str) != 8 or not timestamp_str.isalnum():
+                raise ValueError
+            timestamp = int(timestamp_str, 16)
+        except ValueError:
+            raise ValueError(f"Invalid interrupt message format: {message!r}") from None
+        data_str = message[9:]
 
         # Parse data fields based on bit_cap
         data = self._parse_data_fields(timestamp, data_str)
-        logger.debug(f"Position compare data: ts={timestamp:#010x}")
+        logger.debug("Position compare data: ts=%#010x", timestamp)
 
         await self._dispatch_data(data)
         return True
 
+    async def handle_messages(self, messages: Sequence[str]) -> None:
+        """Parse and dispatch a burst of interrupt messages, oldest first.
+
+        Runs of consecutive data messages are decoded together with
+        parse_data_messages. Non-interrupt messages are skipped. An invalid
+        interrupt message is logged and skipped, so the rest of the burst
+        (such as a trailing PX) is still dispatched.
+
+        Args:
+            messages: Raw message lines from Zebra
+        """
+        data_run: list[str] = []
+        for message in messages:
+            if message.startswith("P") and message != "PR" and message != "PX":
+                data_run.append(message)
+                continue
+            if data_run:
+                await self._handle_data_run(data_run)
+                data_run = []
+            await self._handle_message_logged(message)
+        if data_run:
+            await self._handle_data_run(data_run)
+
+    async def _handle_data_run(self, messages: list[str]) -> None:
+        """Dispatch consecutive data messages.
+
+        Args:
+            messages: Data messages, oldest first
+        """
+        if len(messages) == 1:
+            await self._handle_message_logged(messages[0])
+            return
+
+        try:
+            points = self.parse_data_messages(messages)
+        except ValueError:
+            # Go one at a time so only the bad messages are skipped
+            for message in messages:
+                await self._handle_message_logged(message)
+            return
+
+        logger.debug("Position compare data: %d points", len(points))
+        for data in points:
+            await self._dispatch_data(data)
+
+    async def _handle_message_logged(self, message: str) -> None:
+        """Handle one message, logging rather than raising if it is invalid.
+
+        Args:
+            message: Raw message line from Zebra
+        """
+        try:
+            await self.handle_message(message)
+        except ValueError as e:
+            logger.error("Skipping invalid interrupt message %r: %s", message, e)
+
+    def parse_data_messages(self, messages: Sequence[str]) -> list[PositionCompareData]:
+        """Parse several data messages at once.
+
+        The hex of all messages is decoded in one call and split into
+        timestamps and fields with ``struct.iter_unpack``, which is much
+        faster than parsing long captures one message at a time.
+
+        Args:
+            messages: Data messages (P<TTTTTTTT><fields>) for the current
+                PC_BIT_CAP
+
+        Returns:
+            Parsed data points, in message order
+
+        Raises:
+            ValueError: If any message is not a valid data message
+        """
+        message_len = 9 + self._expected_len  # P, timestamp, fields
+        payloads = []
+        for message in messages:
+            payload = message[1:]
+            # fromhex skips whitespace, so without the isalnum() check a
+            # message could decode to fewer bytes and shift every later row
+            if (
+                len(message) != message_len
+                or not message.startswith("P")
+                or not payload.isalnum()
+            ):
+                raise ValueError(f"Invalid data message: {message!r}")
+            payloads.append(payload)
+
+        # Every payload is a whole row of hex, so there is one row per message
+        raw = bytes.fromhex("".join(payloads))
+        names = self._field_names
+        return [
+            PositionCompareData(row[0], **dict(zip(names, row[1:], strict=True)))
+            for row in self._message_struct.iter_unpack(raw)
+        ]
+
     def _parse_data_fields(self, timestamp: int, data_str: str) -> PositionCompareData:
         """Parse data fields from interrupt message.
 
@@ -187,67 +423,29 @@ class InterruptHandler:
             Parsed data point
 
         Raises:
-            ValueError: If data string length doesn't match bit_cap
+            ValueError: If data string length doesn't match bit_cap or the
+                data is not hex
         """
-        data = PositionCompareData(timestamp=timestamp)
-
-        # Each enabled bit adds 8 hex chars (32 bits)
-        num_fields = bin(self.bit_cap).count("1")
-        expected_len = num_fields * 8
-
+        expected_len = self._expected_len
         if len(data_str) != expected_len:
             raise ValueError(
                 f"Data length mismatch: expected {expected_len} chars "
                 f"for bit_cap {self.bit_cap:#06x}, got {len(data_str)}"
             )
 
-        # Parse fields in order of bit position
-        offset = 0
-
-        # Field mapping: (bit, field_name, is_signed)
-        field_map = [
-            (0, "encoder1", True),
-            (1, "encoder2", True),
-            (2, "encoder3", True),
-            (3, "encoder4", True),
-            (4, "sysbus1", False),
-            (5, "sysbus2", False),
-            (6, "div1", False),
-            (7, "div2", False),
-            (8, "div3", False),
-            (9, "div4", False),
-        ]
-
-        for bit, field_name, is_signed in field_map:
-            if self.bit_cap & (1 << bit):
-                # Extract 8 hex chars (32 bits)
-                hex_str = data_str[offset : offset + 8]
-                offset += 8
+        # Decode the hex once and let struct split and sign the fields
+        try:
+            values = self._fields_struct.unpack(bytes.fromhex(data_str))
+        except struct.error:  # fromhex skips whitespace, leaving too few bytes
+            raise ValueError(f"Invalid interrupt data: {data_str!r}") from None
 
-                # Parse as unsigned 32-bit
-                unsigned_value = int(hex_str, 16)
-
-                # Convert to signed if needed
-                if is_signed:
-                    # Two's complement for signed 32-bit
-                    if unsigned_value >= 0x80000000:
-                        value = unsigned_value - 0x100000000
-                    else:
-                        value = unsigned_value
-                else:
-                    value = unsigned_value
-
-                setattr(data, field_name, value)
-
-        return data
+        # Construct in one go rather than setting each field afterwards
+        fields = dict(zip(self._field_names, values, strict=True))
+        return PositionCompareData(timestamp, **fields)
 
     async def _dispatch_reset(self) -> None:
         """Call all reset callbacks."""
-        for callback in self._reset_callbacks:
-            try:
-                await callback()
-            except Exception as e:
-                logger.error(f"Error in reset callback: {e}", exc_info=True)
+        await _dispatch(self._reset_callbacks, "reset")
 
     async def _dispatch_data(self, data: PositionCompareData) -> None:
         """Call all data callbacks.
@@ -255,16 +453,39 @@ class InterruptHandler:
         Args:
             data: Parsed data point
         """
-        for callback in self._data_callbacks:
-            try:
-                await callback(data)
-            except Exception as e:
-                logger.error(f"Error in data callback: {e}", exc_info=True)
+        await _dispatch(self._data_callbacks, "data", data)
 
     async def _dispatch_end(self) -> None:
         """Call all end callbacks."""
-        for callback in self._end_callbacks:
-            try:
-                await callback()
-            except Exception as e:
-                logger.error(f"Error in end callback: {e}", exc_info=True)
+        await _dispatch(self._end_callbacks, "end")
+
+
+async def _dispatch(
+    callbacks: tuple[Callable[..., Awaitable[None]], ...], kind: str, *args
+) -> None:
+    """Call interrupt callbacks, logging rather than raising their errors.
+
+    A single callback (the usual case) is awaited directly; several are run
+    concurrently.
+
+    Args:
+        callbacks: Callbacks to call
+        kind: Event name for error messages
+        *args: Arguments for each callback
+    """
+    if not callbacks:
+        return
+
+    if len(callbacks) == 1:
+        try:
+            await callbacks[0](*args)
+        except Exception as e:
+            logger.error("Error in %s callback: %s", kind, e, exc_info=True)
+        return
+
+    results = await asyncio.gather(
+        *(callback(*args) for callback in callbacks), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Error in %s callback: %s", kind, result, exc_info=result)
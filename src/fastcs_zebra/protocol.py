@@ -14,17 +14,26 @@ Protocol format:
 Where:
 - <AA> = 2-digit hex register address (00-FF)
 - <VVVV> = 4-digit hex value (0000-FFFF, 16-bit)
+
+Writes are not read back by default, as that doubles the round trips per
+write and the polling loop reads the registers again anyway. Pass
+verify=True, or use write_register_verified, when the written value must be
+confirmed straight away.
 """
 
 import asyncio
 import logging
 import re
+from collections.abc import Sequence
 from typing import Literal
 
 from .transport import ZebraTransport
 
 logger = logging.getLogger(__name__)
 
+# Read command R<AA> for every register address, indexed by address
+_READ_COMMANDS = tuple(f"R{address:02X}" for address in range(0x100))
+
 
 class ProtocolError(Exception):
     """Base exception for protocol-level errors."""
@@ -52,11 +61,12 @@ class ZebraProtocol:
     error detection, and verification.
     """
 
-    # Response format patterns
-    READ_RESPONSE_PATTERN = re.compile(r"^R([0-9A-F]{2})([0-9A-F]{4})$")
-    WRITE_RESPONSE_PATTERN = re.compile(r"^W([0-9A-F]{2})OK$")
+    # Error response pattern (read and write responses are parsed by slicing)
     ERROR_PATTERN = re.compile(r"^E([01])([RW])?([0-9A-F]{2})?$")
 
+    # Most read commands sent to the Zebra in one write
+    MAX_READ_BATCH = 16
+
     def __init__(self, transport: ZebraTransport):
         """Initialize protocol handler.
 
@@ -67,6 +77,9 @@ class ZebraProtocol:
         # Lock to serialize all register operations - serial requires strict
         # request-response pairing, only one operation at a time
         self._lock = asyncio.Lock()
+        # Reads requested since the last flush, coalesced by address
+        self._pending_reads: dict[int, asyncio.Future[int]] = {}
+        self._flush_task: asyncio.Task | None = None
 
     async def _read_register_unlocked(self, address: int) -> int:
         """Read a 16-bit register value without acquiring lock.
@@ -89,8 +102,8 @@ class ZebraProtocol:
             )
 
         # Send read command: R<AA>
-        command = f"R{address:02X}"
-        logger.debug(f"Reading register {address:#04x}")
+        command = _READ_COMMANDS[address]
+        logger.debug("Reading register %#04x", address)
 
         await self.transport.write_line(command)
 
@@ -101,6 +114,11 @@ class ZebraProtocol:
     async def read_register(self, address: int) -> int:
         """Read a 16-bit register value.
 
+        Reads requested by different tasks in the same event loop iteration
+        are coalesced: their commands are sent in one write and the responses
+        read back in order, rather than one full round trip each. Concurrent
+        reads of the same address share a single command.
+
         Args:
             address: Register address (0x00-0xFF)
 
@@ -111,9 +129,100 @@ class ZebraProtocol:
             ValueError: If address out of range
             ProtocolError: If read fails or response invalid
         """
-        # Acquire lock to ensure atomic read operation (command + response)
-        async with self._lock:
-            return await self._read_register_unlocked(address)
+        if not 0 <= address <= 0xFF:
+            raise ValueError(
+                f"Register address {address:#04x} out of range [0x00-0xFF]"
+            )
+
+        future = self._pending_reads.get(address)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_reads[address] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_reads())
+                self._flush_task.add_done_callback(self._on_flush_done)
+
+        # Shield so a cancelled caller does not cancel the read for others
+        return await asyncio.shield(future)
+
+    async def read_registers(self, addresses: Sequence[int]) -> list[int]:
+        """Read several 16-bit registers in one pipelined batch.
+
+        Args:
+            addresses: Register addresses (0x00-0xFF)
+
+        Returns:
+            Register values, in the same order as addresses
+
+        Raises:
+            ValueError: If an address is out of range
+            ProtocolError: If a read fails or a response is invalid
+        """
+        # Issued in the same loop iteration, so they share one flush
+        return list(await asyncio.gather(*map(self.read_register, addresses)))
+
+    async def _flush_reads(self) -> None:
+        """Send all pending reads and resolve their futures."""
+        batch: dict[int, asyncio.Future[int]] = {}
+        try:
+            # Acquire lock to ensure atomic batch (commands + responses)
+            async with self._lock:
+                batch = self._pending_reads
+                self._pending_reads = {}
+                self._flush_task = None
+
+                addresses = list(batch)
+                try:
+                    for start in range(0, len(addresses), self.MAX_READ_BATCH):
+                        chunk = addresses[start : start + self.MAX_READ_BATCH]
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Reading registers %s", [hex(a) for a in chunk]
+                            )
+
+                        # Send read commands: R<AA>
+                        await self.transport.write_lines(
+                            [_READ_COMMANDS[a] for a in chunk]
+                        )
+
+                        # Get responses in order: R<AA><VVVV> or error
+                        for address in chunk:
+                            response = await self.transport.read_line()
+                            future = batch[address]
+                            if future.done():
+                                continue
+                            try:
+                                future.set_result(
+                                    self._parse_read_response(address, response)
+                                )
+                            except ProtocolError as e:
+                                future.set_exception(e)
+                except Exception as e:
+                    # Transport failure - fail every read that has no result yet
+                    for future in batch.values():
+                        if not future.done():
+                            future.set_exception(e)
+        finally:
+            # Cancelled part way through - cancel the reads that are left so
+            # their callers do not wait forever
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        """Cancel the pending reads of a flush that never took its batch.
+
+        This happens when the flush task is cancelled before it starts or
+        while it waits for the lock.
+        """
+        if self._flush_task is not task:
+            return
+        batch = self._pending_reads
+        self._pending_reads = {}
+        self._flush_task = None
+        for future in batch.values():
+            if not future.done():
+                future.cancel()
 
     async def _write_register_unlocked(self, address: int, value: int) -> None:
         """Write a 16-bit value to a register without acquiring lock.
@@ -128,6 +237,68 @@ class ZebraProtocol:
             ValueError: If address or value out of range
             ProtocolError: If write fails
         """
+        command = self._write_command(address, value)
+        logger.debug("Writing %#06x to register %#04x", value, address)
+
+        await self.transport.write_line(command)
+
+        # Get response: W<AA>OK or error
+        response = await self.transport.read_line()
+        self._parse_write_response(address, response)
+
+    async def _write_register_pair_unlocked(
+        self, address_lo: int, value_lo: int, address_hi: int, value_hi: int
+    ) -> None:
+        """Write two 16-bit registers in one pipelined batch without lock.
+
+        Internal method - caller must hold self._lock.
+
+        Args:
+            address_lo: Address of the first register to write
+            value_lo: Value for the first register (0x0000-0xFFFF)
+            address_hi: Address of the second register to write
+            value_hi: Value for the second register (0x0000-0xFFFF)
+
+        Raises:
+            ValueError: If an address or value is out of range
+            ProtocolError: If either write fails
+        """
+        commands = [
+            self._write_command(address_lo, value_lo),
+            self._write_command(address_hi, value_hi),
+        ]
+        logger.debug(
+            "Writing %#06x to register %#04x and %#06x to register %#04x",
+            value_lo,
+            address_lo,
+            value_hi,
+            address_hi,
+        )
+
+        # Send both write commands at once: W<AA><VVVV>
+        await self.transport.write_lines(commands)
+
+        # Read both responses before parsing, so an error in the first does
+        # not leave the second response unread
+        response_lo = await self.transport.read_line()
+        response_hi = await self.transport.read_line()
+        self._parse_write_response(address_lo, response_lo)
+        self._parse_write_response(address_hi, response_hi)
+
+    @staticmethod
+    def _write_command(address: int, value: int) -> str:
+        """Build the write command for a register.
+
+        Args:
+            address: Register address (0x00-0xFF)
+            value: Value to write (0x0000-0xFFFF)
+
+        Returns:
+            Write command W<AA><VVVV>
+
+        Raises:
+            ValueError: If address or value out of range
+        """
         if not 0 <= address <= 0xFF:
             raise ValueError(
                 f"Register address {address:#04x} out of range [0x00-0xFF]"
@@ -136,35 +307,27 @@ class ZebraProtocol:
             raise ValueError(
                 f"Register value {value:#06x} out of range [0x0000-0xFFFF]"
             )
-
-        # Send write command: W<AA><VVVV>
-        command = f"W{address:02X}{value:04X}"
-        logger.debug(f"Writing {value:#06x} to register {address:#04x}")
-
-        await self.transport.write_line(command)
-
-        # Get response: W<AA>OK or error
-        response = await self.transport.read_line()
-        self._parse_write_response(address, response)
+        return f"W{address:02X}{value:04X}"
 
     async def write_register(
-        self, address: int, value: int, verify: bool = True
+        self, address: int, value: int, verify: bool = False
     ) -> int:
         """Write a 16-bit value to a register.
 
         Args:
             address: Register address (0x00-0xFF)
             value: Value to write (0x0000-0xFFFF)
-            verify: If True, read back value to verify write
+            verify: If True, read the value back and log a warning if it
+                differs from the value written
 
         Returns:
-            Verified value if verify=True, else written value
+            Value read back if verify=True, else written value
 
         Raises:
             ValueError: If address or value out of range
-            ProtocolError: If write fails or verification mismatch
+            ProtocolError: If the write or readback fails
         """
-        # Acquire lock to ensure atomic write+verify operation
+        # Hold the lock so that any readback directly follows the write
         async with self._lock:
             await self._write_register_unlocked(address, value)
 
@@ -180,6 +343,45 @@ class ZebraProtocol:
 
             return value
 
+    async def write_register_verified(self, address: int, value: int) -> int:
+        """Write a 16-bit value to a register and read it back.
+
+        Args:
+            address: Register address (0x00-0xFF)
+            value: Value to write (0x0000-0xFFFF)
+
+        Returns:
+            Value read back from the register
+
+        Raises:
+            ValueError: If address or value out of range
+            ProtocolError: If write or readback fails
+        """
+        return await self.write_register(address, value, verify=True)
+
+    async def write_register_pair(
+        self, address_lo: int, value_lo: int, address_hi: int, value_hi: int
+    ) -> None:
+        """Write two 16-bit registers in one pipelined batch.
+
+        Both commands are sent in a single write and then both responses are
+        read, taking one round trip rather than two.
+
+        Args:
+            address_lo: Address of the first register to write
+            value_lo: Value for the first register (0x0000-0xFFFF)
+            address_hi: Address of the second register to write
+            value_hi: Value for the second register (0x0000-0xFFFF)
+
+        Raises:
+            ValueError: If an address or value is out of range
+            ProtocolError: If either write fails
+        """
+        async with self._lock:
+            await self._write_register_pair_unlocked(
+                address_lo, value_lo, address_hi, value_hi
+            )
+
     async def read_register_32bit(self, address_lo: int, address_hi: int) -> int:
         """Read a 32-bit value from LO/HI register pair.
 
@@ -190,28 +392,53 @@ class ZebraProtocol:
         Returns:
             32-bit value (HI << 16 | LO)
         """
-        # Hold lock for entire 32-bit read to prevent interleaving
-        async with self._lock:
-            lo = await self._read_register_unlocked(address_lo)
-            hi = await self._read_register_unlocked(address_hi)
-            value = (hi << 16) | lo
+        # Both commands go out in the same batch, so the halves are read back
+        # to back without waiting a round trip in between
+        lo, hi = await self.read_registers((address_lo, address_hi))
+        value = (hi << 16) | lo
 
-            logger.debug(
-                f"Read 32-bit value {value:#010x} from "
-                f"[{address_hi:#04x}:{address_lo:#04x}]"
-            )
-            return value
+        logger.debug(
+            "Read 32-bit value %#010x from [%#04x:%#04x]",
+            value,
+            address_hi,
+            address_lo,
+        )
+        return value
+
+    async def read_registers_32bit(
+        self, address_pairs: Sequence[tuple[int, int]]
+    ) -> list[int]:
+        """Read several 32-bit values from LO/HI register pairs in one batch.
+
+        Every half is read in the same pipelined batch, so dumping all the
+        32-bit registers costs a few round trips rather than one per pair.
+
+        Args:
+            address_pairs: (address_lo, address_hi) of each value
+
+        Returns:
+            32-bit values (HI << 16 | LO), in the same order as address_pairs
+
+        Raises:
+            ValueError: If an address is out of range
+            ProtocolError: If a read fails or a response is invalid
+        """
+        halves = await self.read_registers(
+            [address for pair in address_pairs for address in pair]
+        )
+        pairs = zip(halves[::2], halves[1::2], strict=True)
+        return [(hi << 16) | lo for lo, hi in pairs]
 
     async def write_register_32bit(
         self,
         address_lo: int,
         address_hi: int,
         value: int,
-        verify: bool = True,
+        verify: bool = False,
     ) -> int:
         """Write a 32-bit value to LO/HI register pair.
 
-        Writes LO register first, then HI register.
+        Writes LO register first, then HI register, in one pipelined batch.
 
         Args:
             address_lo: Address of low 16 bits
@@ -232,15 +459,16 @@ class ZebraProtocol:
         hi = (value >> 16) & 0xFFFF
 
         logger.debug(
-            f"Writing 32-bit value {value:#010x} to "
-            f"[{address_hi:#04x}:{address_lo:#04x}]"
+            "Writing 32-bit value %#010x to [%#04x:%#04x]",
+            value,
+            address_hi,
+            address_lo,
         )
 
-        # Hold lock for entire 32-bit write+verify to prevent interleaving
+        # Hold lock for the 32-bit write and any readback to prevent interleaving
         async with self._lock:
-            # Write LO then HI
-            await self._write_register_unlocked(address_lo, lo)
-            await self._write_register_unlocked(address_hi, hi)
+            # Write LO then HI, pipelined
+            await self._write_register_pair_unlocked(address_lo, lo, address_hi, hi)
 
             # Optionally verify
             if verify:
@@ -303,14 +531,17 @@ class ZebraProtocol:
         # Check for error response first
         self._check_error_response(response)
 
-        # Parse read response: R<AA><VVVV>
-        match = self.READ_RESPONSE_PATTERN.match(response)
-        if not match:
-            raise MalformedResponseError(f"Invalid read response format: {response!r}")
-
-        addr_str, value_str = match.groups()
-        response_addr = int(addr_str, 16)
-        value = int(value_str, 16)
+        # Parse read response: R<AA><VVVV>. isalnum() rejects the sign,
+        # underscore and whitespace characters that int() would accept.
+        try:
+            if len(response) != 7 or response[0] != "R" or not response.isalnum():
+                raise ValueError
+            response_addr = int(response[1:3], 16)
+            value = int(response[3:], 16)
+        except ValueError:
+            raise MalformedResponseError(
+                f"Invalid read response format: {response!r}"
+            ) from None
 
         # Verify address matches
         if response_addr != address:
@@ -318,7 +549,7 @@ class ZebraProtocol:
                 f"Address mismatch: expected {address:#04x}, got {response_addr:#04x}"
             )
 
-        logger.debug(f"Read {value:#06x} from register {address:#04x}")
+        logger.debug("Read %#06x from register %#04x", value, address)
         return value
 
     def _parse_write_response(self, address: int, response: str) -> None:
@@ -335,12 +566,19 @@ class ZebraProtocol:
         self._check_error_response(response)
 
         # Parse write response: W<AA>OK
-        match = self.WRITE_RESPONSE_PATTERN.match(response)
-        if not match:
-            raise MalformedResponseError(f"Invalid write response format: {response!r}")
-
-        addr_str = match.group(1)
-        response_addr = int(addr_str, 16)
+        try:
+            if (
+                len(response) != 5
+                or response[0] != "W"
+                or not response.endswith("OK")
+                or not response.isalnum()
+            ):
+                raise ValueError
+            response_addr = int(response[1:3], 16)
+        except ValueError:
+            raise MalformedResponseError(
+                f"Invalid write response format: {response!r}"
+            ) from None
 
         # Verify address matches
         if response_addr != address:
@@ -348,7 +586,7 @@ class ZebraProtocol:
                 f"Address mismatch: expected {address:#04x}, got {response_addr:#04x}"
             )
 
-        logger.debug(f"Write to register {address:#04x} succeeded")
+        logger.debug("Write to register %#04x succeeded", address)
 
     def _check_error_response(self, response: str) -> None:
         """Check if response is an error and raise appropriate exception.
@@ -359,6 +597,10 @@ class ZebraProtocol:
         Raises:
             ProtocolError: If response indicates an error
         """
+        # Successful responses never start with "E", so skip the regex for them
+        if not response.startswith("E"):
+            return
+
         match = self.ERROR_PATTERN.match(response)
         if not match:
             return  # Not an error response
@@ -5,11 +5,15 @@ to Zebra registers. They are separated from the main controller to avoid
 circular imports with sub-controllers.
 """
 
+import logging
 from dataclasses import dataclass
+from functools import cache
 from typing import TypeVar
 
 from fastcs.attributes import AttributeIO, AttributeIORef, AttrRW
 
+logger = logging.getLogger(__name__)
+
 NumberT = TypeVar("NumberT", int, float)
 
 
@@ -17,6 +21,11 @@ NumberT = TypeVar("NumberT", int, float)
 class ZebraRegisterIORef(AttributeIORef):
     """Reference for Zebra register IO operations.
 
+    Create references with ``get``, which returns one shared instance per set
+    of arguments. Instances must not be mutated: a change would affect every
+    attribute sharing the reference. (The class cannot be a frozen dataclass
+    because the FastCS base class is not frozen.)
+
     Attributes:
         register: Register address (0x00-0xFF)
         is_32bit: True if this is a 32-bit register pair
@@ -29,6 +38,47 @@ class ZebraRegisterIORef(AttributeIORef):
     register_hi: int | None = None  # High register for 32-bit values
     update_period: float | None = 1.0  # Poll every second by default
 
+    @classmethod
+    def get(
+        cls,
+        register: int,
+        is_32bit: bool = False,
+        register_hi: int | None = None,
+        update_period: float | None = 1.0,
+    ) -> "ZebraRegisterIORef":
+        """Get a shared reference for the given register and update period.
+
+        Attributes for the same register (e.g. the top level PC_ENC and the
+        position compare controller's enc) then share one reference object.
+        Shared references must not be modified.
+
+        Args:
+            register: Register address (0x00-0xFF)
+            is_32bit: True if this is a 32-bit register pair
+            register_hi: High register address for 32-bit values
+            update_period: Poll period in seconds
+
+        Returns:
+            Interned ZebraRegisterIORef
+        """
+        return _interned_io_ref(cls, register, is_32bit, register_hi, update_period)
+
+
+@cache
+def _interned_io_ref(
+    cls: type[ZebraRegisterIORef],
+    register: int,
+    is_32bit: bool,
+    register_hi: int | None,
+    update_period: float | None,
+) -> ZebraRegisterIORef:
+    return cls(
+        register=register,
+        is_32bit=is_32bit,
+        register_hi=register_hi,
+        update_period=update_period,
+    )
+
 
 class ZebraRegisterIO(AttributeIO[NumberT, ZebraRegisterIORef]):
     """Handles reading from and writing to Zebra registers.
@@ -64,21 +114,20 @@ class ZebraRegisterIO(AttributeIO[NumberT, ZebraRegisterIORef]):
         if not self._protocol:
             return
 
+        io_ref = attr.io_ref
         try:
-            if attr.io_ref.is_32bit and attr.io_ref.register_hi is not None:
+            if io_ref.is_32bit and io_ref.register_hi is not None:
                 value = await self._protocol.read_register_32bit(
-                    attr.io_ref.register, attr.io_ref.register_hi
+                    io_ref.register, io_ref.register_hi
                 )
             else:
-                value = await self._protocol.read_register(attr.io_ref.register)
+                value = await self._protocol.read_register(io_ref.register)
 
-            await attr.update(attr.dtype(value))
+            # Registers read as int, so only non-int types (enums) need a cast
+            dtype = attr.dtype
+            await attr.update(value if dtype is int else dtype(value))
         except Exception as e:
-            # Import logging here to avoid circular imports at module level
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error reading register 0x{attr.io_ref.register:02X}: {e}")
+            logger.error("Error reading register 0x%02X: %s", io_ref.register, e)
 
     async def send(self, attr, value):
         """Write attribute value to Zebra register.
@@ -90,24 +139,24 @@ class ZebraRegisterIO(AttributeIO[NumberT, ZebraRegisterIORef]):
         if not self._protocol:
             return
 
+        io_ref = attr.io_ref
         try:
             int_value = int(value)
-            if attr.io_ref.is_32bit and attr.io_ref.register_hi is not None:
-                # Write 32-bit value as LO/HI pair
+            if io_ref.is_32bit and io_ref.register_hi is not None:
+                # Write 32-bit value as LO/HI pair, both in one round trip
                 lo_value = int_value & 0xFFFF
                 hi_value = (int_value >> 16) & 0xFFFF
-                await self._protocol.write_register(attr.io_ref.register, lo_value)
-                await self._protocol.write_register(attr.io_ref.register_hi, hi_value)
+                await self._protocol.write_register_pair(
+                    io_ref.register, lo_value, io_ref.register_hi, hi_value
+                )
             else:
-                await self._protocol.write_register(attr.io_ref.register, int_value)
+                await self._protocol.write_register(io_ref.register, int_value)
 
             # Read back and update the attribute to reflect actual hardware state
-            # Only if this is a read-write attribute (AttrRW has update method)
+            # Only if this is a read-write attribute (AttrRW has update method).
+            # 32-bit halves are read back together in one batch.
             if isinstance(attr, AttrRW):
                 await self.update(attr)
 
         except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error writing register 0x{attr.io_ref.register:02X}: {e}")
+            logger.error("Error writing register 0x%02X: %s", io_ref.register, e)
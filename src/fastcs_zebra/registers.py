@@ -11,8 +11,10 @@ including:
 Reference: https://github.com/DiamondLightSource/zebra/blob/fastcs-experiment/zebraApp/src/zebraRegs.h
 """
 
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
+from types import MappingProxyType
 
 
 class RegisterType(Enum):
@@ -178,6 +180,11 @@ class SysBus(IntEnum):
     SOFT_IN4 = 63
 
 
+# Signal names indexed by system bus index, and the reverse mapping
+_SIGNAL_NAMES: tuple[str, ...] = tuple(signal.name for signal in SysBus)
+_SIGNAL_INDICES: dict[str, int] = {signal.name: signal.value for signal in SysBus}
+
+
 def signal_index_to_name(index: int) -> str:
     """Convert system bus signal index to name.
 
@@ -190,9 +197,75 @@ def signal_index_to_name(index: int) -> str:
     Raises:
         ValueError: If index out of range
     """
-    if not 0 <= index <= len(SysBus) - 1:
+    if not 0 <= index < len(_SIGNAL_NAMES):
         raise ValueError(f"Signal index must be 0-63, got {index}")
-    return SysBus(index).name
+    return _SIGNAL_NAMES[index]
+
+
+def signal_indices_to_names(indices: Iterable[int]) -> list[str]:
+    """Convert several system bus signal indices to names.
+
+    Useful for naming the active signals of a status word in one call, rather
+    than calling signal_index_to_name for each of them.
+
+    Args:
+        indices: Signal indices (0-63)
+
+    Returns:
+        Signal names, in the same order as indices
+
+    Raises:
+        ValueError: If any index is out of range
+    """
+    indices = tuple(indices)
+    # One bounds check for the whole batch, then plain tuple indexing
+    if indices and not (0 <= min(indices) and max(indices) < len(_SIGNAL_NAMES)):
+        bad = next(i for i in indices if not 0 <= i < len(_SIGNAL_NAMES))
+        raise ValueError(f"Signal index must be 0-63, got {bad}")
+    return [_SIGNAL_NAMES[index] for index in indices]
+
+
+def decode_sys_stat(sys_stat1: int, sys_stat2: int) -> list[str]:
+    """Name the system bus signals that are high in SYS_STAT1/SYS_STAT2.
+
+    Only the set bits are visited, so a mostly idle bus takes a few steps
+    rather than one per signal.
+
+    Args:
+        sys_stat1: System bus status for signals 0-31
+        sys_stat2: System bus status for signals 32-63
+
+    Returns:
+        Names of the active signals, lowest index first
+
+    >>> decode_sys_stat(0b11 << 29, 1 << 31)
+    ['PC_ARM', 'PC_GATE', 'SOFT_IN4']
+    """
+    word = (sys_stat1 & 0xFFFFFFFF) | (sys_stat2 & 0xFFFFFFFF) << 32
+    names = []
+    while word:
+        lowest = word & -word
+        names.append(_SIGNAL_NAMES[lowest.bit_length() - 1])
+        word ^= lowest
+    return names
+
+
+def signal_name_to_index(name: str) -> int:
+    """Convert system bus signal name to index.
+
+    Args:
+        name: Signal name (e.g., 'IN1_TTL', 'PC_GATE')
+
+    Returns:
+        Signal index (0-63)
+
+    Raises:
+        KeyError: If name is not a system bus signal
+    """
+    try:
+        return _SIGNAL_INDICES[name]
+    except KeyError:
+        raise KeyError(f"Unknown signal name: {name!r}") from None
 
 
 # =============================================================================
@@ -206,115 +279,119 @@ _REGISTERS: tuple[Register, ...] = (
     # AND Gate Configuration (AND1-AND4)
     # -------------------------------------------------------------------------
     # Inversion registers (bitfield: bits 0-3 control inversion of inputs 1-4)
-    Register("AND1_INV", 0x00, RegisterType.RW, "AND1 input inversion mask"),
-    Register("AND2_INV", 0x01, RegisterType.RW, "AND2 input inversion mask"),
-    Register("AND3_INV", 0x02, RegisterType.RW, "AND3 input inversion mask"),
-    Register("AND4_INV", 0x03, RegisterType.RW, "AND4 input inversion mask"),
+    *(
+        Register(
+            f"AND{n}_INV", 0x00 + n - 1, RegisterType.RW, f"AND{n} input inversion mask"
+        )
+        for n in range(1, 5)
+    ),
     # Enable registers (bitfield: bits 0-3 enable inputs 1-4)
-    Register("AND1_ENA", 0x04, RegisterType.RW, "AND1 input enable mask"),
-    Register("AND2_ENA", 0x05, RegisterType.RW, "AND2 input enable mask"),
-    Register("AND3_ENA", 0x06, RegisterType.RW, "AND3 input enable mask"),
-    Register("AND4_ENA", 0x07, RegisterType.RW, "AND4 input enable mask"),
+    *(
+        Register(
+            f"AND{n}_ENA", 0x04 + n - 1, RegisterType.RW, f"AND{n} input enable mask"
+        )
+        for n in range(1, 5)
+    ),
     # AND gate input multiplexers (select from 64 system bus signals)
-    Register("AND1_INP1", 0x08, RegisterType.MUX, "AND1 input 1 source"),
-    Register("AND1_INP2", 0x09, RegisterType.MUX, "AND1 input 2 source"),
-    Register("AND1_INP3", 0x0A, RegisterType.MUX, "AND1 input 3 source"),
-    Register("AND1_INP4", 0x0B, RegisterType.MUX, "AND1 input 4 source"),
-    Register("AND2_INP1", 0x0C, RegisterType.MUX, "AND2 input 1 source"),
-    Register("AND2_INP2", 0x0D, RegisterType.MUX, "AND2 input 2 source"),
-    Register("AND2_INP3", 0x0E, RegisterType.MUX, "AND2 input 3 source"),
-    Register("AND2_INP4", 0x0F, RegisterType.MUX, "AND2 input 4 source"),
-    Register("AND3_INP1", 0x10, RegisterType.MUX, "AND3 input 1 source"),
-    Register("AND3_INP2", 0x11, RegisterType.MUX, "AND3 input 2 source"),
-    Register("AND3_INP3", 0x12, RegisterType.MUX, "AND3 input 3 source"),
-    Register("AND3_INP4", 0x13, RegisterType.MUX, "AND3 input 4 source"),
-    Register("AND4_INP1", 0x14, RegisterType.MUX, "AND4 input 1 source"),
-    Register("AND4_INP2", 0x15, RegisterType.MUX, "AND4 input 2 source"),
-    Register("AND4_INP3", 0x16, RegisterType.MUX, "AND4 input 3 source"),
-    Register("AND4_INP4", 0x17, RegisterType.MUX, "AND4 input 4 source"),
+    *(
+        Register(
+            f"AND{n}_INP{i}",
+            0x08 + (n - 1) * 4 + i - 1,
+            RegisterType.MUX,
+            f"AND{n} input {i} source",
+        )
+        for n in range(1, 5)
+        for i in range(1, 5)
+    ),
     # -------------------------------------------------------------------------
     # OR Gate Configuration (OR1-OR4)
     # -------------------------------------------------------------------------
     # Inversion registers
-    Register("OR1_INV", 0x18, RegisterType.RW, "OR1 input inversion mask"),
-    Register("OR2_INV", 0x19, RegisterType.RW, "OR2 input inversion mask"),
-    Register("OR3_INV", 0x1A, RegisterType.RW, "OR3 input inversion mask"),
-    Register("OR4_INV", 0x1B, RegisterType.RW, "OR4 input inversion mask"),
+    *(
+        Register(
+            f"OR{n}_INV", 0x18 + n - 1, RegisterType.RW, f"OR{n} input inversion mask"
+        )
+        for n in range(1, 5)
+    ),
     # Enable registers
-    Register("OR1_ENA", 0x1C, RegisterType.RW, "OR1 input enable mask"),
-    Register("OR2_ENA", 0x1D, RegisterType.RW, "OR2 input enable mask"),
-    Register("OR3_ENA", 0x1E, RegisterType.RW, "OR3 input enable mask"),
-    Register("OR4_ENA", 0x1F, RegisterType.RW, "OR4 input enable mask"),
+    *(
+        Register(
+            f"OR{n}_ENA", 0x1C + n - 1, RegisterType.RW, f"OR{n} input enable mask"
+        )
+        for n in range(1, 5)
+    ),
     # OR gate input multiplexers
-    Register("OR1_INP1", 0x20, RegisterType.MUX, "OR1 input 1 source"),
-    Register("OR1_INP2", 0x21, RegisterType.MUX, "OR1 input 2 source"),
-    Register("OR1_INP3", 0x22, RegisterType.MUX, "OR1 input 3 source"),
-    Register("OR1_INP4", 0x23, RegisterType.MUX, "OR1 input 4 source"),
-    Register("OR2_INP1", 0x24, RegisterType.MUX, "OR2 input 1 source"),
-    Register("OR2_INP2", 0x25, RegisterType.MUX, "OR2 input 2 source"),
-    Register("OR2_INP3", 0x26, RegisterType.MUX, "OR2 input 3 source"),
-    Register("OR2_INP4", 0x27, RegisterType.MUX, "OR2 input 4 source"),
-    Register("OR3_INP1", 0x28, RegisterType.MUX, "OR3 input 1 source"),
-    Register("OR3_INP2", 0x29, RegisterType.MUX, "OR3 input 2 source"),
-    Register("OR3_INP3", 0x2A, RegisterType.MUX, "OR3 input 3 source"),
-    Register("OR3_INP4", 0x2B, RegisterType.MUX, "OR3 input 4 source"),
-    Register("OR4_INP1", 0x2C, RegisterType.MUX, "OR4 input 1 source"),
-    Register("OR4_INP2", 0x2D, RegisterType.MUX, "OR4 input 2 source"),
-    Register("OR4_INP3", 0x2E, RegisterType.MUX, "OR4 input 3 source"),
-    Register("OR4_INP4", 0x2F, RegisterType.MUX, "OR4 input 4 source"),
+    *(
+        Register(
+            f"OR{n}_INP{i}",
+            0x20 + (n - 1) * 4 + i - 1,
+            RegisterType.MUX,
+            f"OR{n} input {i} source",
+        )
+        for n in range(1, 5)
+        for i in range(1, 5)
+    ),
     # -------------------------------------------------------------------------
     # Gate Generator Configuration (GATE1-GATE4)
     # -------------------------------------------------------------------------
     # Trigger inputs (set output high)
-    Register("GATE1_INP1", 0x30, RegisterType.MUX, "GATE1 trigger input"),
-    Register("GATE2_INP1", 0x31, RegisterType.MUX, "GATE2 trigger input"),
-    Register("GATE3_INP1", 0x32, RegisterType.MUX, "GATE3 trigger input"),
-    Register("GATE4_INP1", 0x33, RegisterType.MUX, "GATE4 trigger input"),
+    *(
+        Register(
+            f"GATE{n}_INP1", 0x30 + n - 1, RegisterType.MUX, f"GATE{n} trigger input"
+        )
+        for n in range(1, 5)
+    ),
     # Reset inputs (set output low)
-    Register("GATE1_INP2", 0x34, RegisterType.MUX, "GATE1 reset input"),
-    Register("GATE2_INP2", 0x35, RegisterType.MUX, "GATE2 reset input"),
-    Register("GATE3_INP2", 0x36, RegisterType.MUX, "GATE3 reset input"),
-    Register("GATE4_INP2", 0x37, RegisterType.MUX, "GATE4 reset input"),
+    *(
+        Register(
+            f"GATE{n}_INP2", 0x34 + n - 1, RegisterType.MUX, f"GATE{n} reset input"
+        )
+        for n in range(1, 5)
+    ),
     # -------------------------------------------------------------------------
     # Pulse Divider Configuration (DIV1-DIV4)
     # Note: DIVn_DIV registers are 32-bit (LO/HI pairs) - see _REGISTERS_32BIT
     # -------------------------------------------------------------------------
-    Register("DIV1_DIVLO", 0x38, RegisterType.RW, "DIV1 divisor low 16 bits"),
-    Register("DIV1_DIVHI", 0x39, RegisterType.RW, "DIV1 divisor high 16 bits"),
-    Register("DIV2_DIVLO", 0x3A, RegisterType.RW, "DIV2 divisor low 16 bits"),
-    Register("DIV2_DIVHI", 0x3B, RegisterType.RW, "DIV2 divisor high 16 bits"),
-    Register("DIV3_DIVLO", 0x3C, RegisterType.RW, "DIV3 divisor low 16 bits"),
-    Register("DIV3_DIVHI", 0x3D, RegisterType.RW, "DIV3 divisor high 16 bits"),
-    Register("DIV4_DIVLO", 0x3E, RegisterType.RW, "DIV4 divisor low 16 bits"),
-    Register("DIV4_DIVHI", 0x3F, RegisterType.RW, "DIV4 divisor high 16 bits"),
+    *(
+        Register(
+            f"DIV{n}_DIV{half}",
+            0x38 + (n - 1) * 2 + offset,
+            RegisterType.RW,
+            f"DIV{n} divisor {bits} 16 bits",
+        )
+        for n in range(1, 5)
+        for offset, (half, bits) in enumerate((("LO", "low"), ("HI", "high")))
+    ),
     # Divider input multiplexers
-    Register("DIV1_INP", 0x40, RegisterType.MUX, "DIV1 input source"),
-    Register("DIV2_INP", 0x41, RegisterType.MUX, "DIV2 input source"),
-    Register("DIV3_INP", 0x42, RegisterType.MUX, "DIV3 input source"),
-    Register("DIV4_INP", 0x43, RegisterType.MUX, "DIV4 input source"),
+    *(
+        Register(f"DIV{n}_INP", 0x40 + n - 1, RegisterType.MUX, f"DIV{n} input source")
+        for n in range(1, 5)
+    ),
     # -------------------------------------------------------------------------
     # Pulse Generator Configuration (PULSE1-PULSE4)
     # -------------------------------------------------------------------------
     # Pulse delay (time from trigger to pulse start)
-    Register("PULSE1_DLY", 0x44, RegisterType.RW, "PULSE1 delay"),
-    Register("PULSE2_DLY", 0x45, RegisterType.RW, "PULSE2 delay"),
-    Register("PULSE3_DLY", 0x46, RegisterType.RW, "PULSE3 delay"),
-    Register("PULSE4_DLY", 0x47, RegisterType.RW, "PULSE4 delay"),
+    *(
+        Register(f"PULSE{n}_DLY", 0x44 + n - 1, RegisterType.RW, f"PULSE{n} delay")
+        for n in range(1, 5)
+    ),
     # Pulse width
-    Register("PULSE1_WID", 0x48, RegisterType.RW, "PULSE1 width"),
-    Register("PULSE2_WID", 0x49, RegisterType.RW, "PULSE2 width"),
-    Register("PULSE3_WID", 0x4A, RegisterType.RW, "PULSE3 width"),
-    Register("PULSE4_WID", 0x4B, RegisterType.RW, "PULSE4 width"),
+    *(
+        Register(f"PULSE{n}_WID", 0x48 + n - 1, RegisterType.RW, f"PULSE{n} width")
+        for n in range(1, 5)
+    ),
     # Pulse prescaler (time unit selection)
-    Register("PULSE1_PRE", 0x4C, RegisterType.RW, "PULSE1 prescaler"),
-    Register("PULSE2_PRE", 0x4D, RegisterType.RW, "PULSE2 prescaler"),
-    Register("PULSE3_PRE", 0x4E, RegisterType.RW, "PULSE3 prescaler"),
-    Register("PULSE4_PRE", 0x4F, RegisterType.RW, "PULSE4 prescaler"),
+    *(
+        Register(f"PULSE{n}_PRE", 0x4C + n - 1, RegisterType.RW, f"PULSE{n} prescaler")
+        for n in range(1, 5)
+    ),
     # Pulse input multiplexers
-    Register("PULSE1_INP", 0x50, RegisterType.MUX, "PULSE1 input source"),
-    Register("PULSE2_INP", 0x51, RegisterType.MUX, "PULSE2 input source"),
-    Register("PULSE3_INP", 0x52, RegisterType.MUX, "PULSE3 input source"),
-    Register("PULSE4_INP", 0x53, RegisterType.MUX, "PULSE4 input source"),
+    *(
+        Register(
+            f"PULSE{n}_INP", 0x50 + n - 1, RegisterType.MUX, f"PULSE{n} input source"
+        )
+        for n in range(1, 5)
+    ),
     # Output polarity control (bitfield)
     Register("POLARITY", 0x54, RegisterType.RW, "Output polarity control"),
     # -------------------------------------------------------------------------
@@ -480,16 +557,51 @@ _REGISTERS_32BIT: tuple[Register32, ...] = (
 # Lookup Dictionaries (built at module load time)
 # =============================================================================
 
+# The public mappings are read-only views, so the tables cannot be modified
+# by accident. Lookups in this module use the underlying dicts directly.
+
 # Map register name to Register object
-REGISTERS_BY_NAME: dict[str, Register] = {reg.name: reg for reg in _REGISTERS}
+_REGISTERS_BY_NAME: dict[str, Register] = {reg.name: reg for reg in _REGISTERS}
+REGISTERS_BY_NAME: Mapping[str, Register] = MappingProxyType(_REGISTERS_BY_NAME)
 
 # Map register address to Register object
-REGISTERS_BY_ADDRESS: dict[int, Register] = {reg.address: reg for reg in _REGISTERS}
+_REGISTERS_BY_ADDRESS: dict[int, Register] = {reg.address: reg for reg in _REGISTERS}
+REGISTERS_BY_ADDRESS: Mapping[int, Register] = MappingProxyType(_REGISTERS_BY_ADDRESS)
+
+# Register at each address, or None if the address is unused. Indexing this
+# avoids hashing the address on lookup.
+_REGISTER_TABLE: tuple[Register | None, ...] = tuple(
+    _REGISTERS_BY_ADDRESS.get(address) for address in range(0x100)
+)
 
 # Map 32-bit register name to Register32 object
-REGISTERS_32BIT_BY_NAME: dict[str, Register32] = {
+_REGISTERS_32BIT_BY_NAME: dict[str, Register32] = {
     reg.name: reg for reg in _REGISTERS_32BIT
 }
+REGISTERS_32BIT_BY_NAME: Mapping[str, Register32] = MappingProxyType(
+    _REGISTERS_32BIT_BY_NAME
+)
+
+# Registers of each type, in definition order
+_REGISTERS_BY_TYPE: dict[RegisterType, tuple[Register, ...]] = {
+    reg_type: tuple(reg for reg in _REGISTERS if reg.reg_type == reg_type)
+    for reg_type in RegisterType
+}
+_REGISTERS_32BIT_BY_TYPE: dict[RegisterType, tuple[Register32, ...]] = {
+    reg_type: tuple(reg for reg in _REGISTERS_32BIT if reg.reg_type == reg_type)
+    for reg_type in RegisterType
+}
+
+# Addresses of the register types that have an is_*_register check
+_MUX_ADDRESSES: frozenset[int] = frozenset(
+    reg.address for reg in _REGISTERS_BY_TYPE[RegisterType.MUX]
+)
+_RO_ADDRESSES: frozenset[int] = frozenset(
+    reg.address for reg in _REGISTERS_BY_TYPE[RegisterType.RO]
+)
+_CMD_ADDRESSES: frozenset[int] = frozenset(
+    reg.address for reg in _REGISTERS_BY_TYPE[RegisterType.CMD]
+)
 
 
 def get_register(name_or_address: str | int) -> Register:
@@ -505,13 +617,46 @@ def get_register(name_or_address: str | int) -> Register:
         KeyError: If register not found
     """
     if isinstance(name_or_address, str):
-        if name_or_address not in REGISTERS_BY_NAME:
-            raise KeyError(f"Unknown register name: {name_or_address!r}")
-        return REGISTERS_BY_NAME[name_or_address]
-    else:
-        if name_or_address not in REGISTERS_BY_ADDRESS:
-            raise KeyError(f"Unknown register address: {name_or_address:#04x}")
-        return REGISTERS_BY_ADDRESS[name_or_address]
+        return get_register_by_name(name_or_address)
+    return get_register_by_address(name_or_address)
+
+
+def get_register_by_name(name: str) -> Register:
+    """Get a register definition by name.
+
+    Args:
+        name: Register name (e.g., 'PC_ENC')
+
+    Returns:
+        Register definition
+
+    Raises:
+        KeyError: If register not found
+    """
+    reg = _REGISTERS_BY_NAME.get(name)
+    if reg is None:
+        raise KeyError(f"Unknown register name: {name!r}")
+    return reg
+
+
+def get_register_by_address(address: int) -> Register:
+    """Get a register definition by address.
+
+    Args:
+        address: Register address (0x00-0xFF)
+
+    Returns:
+        Register definition
+
+    Raises:
+        KeyError: If register not found
+    """
+    # Range check first, as negative indices would wrap round the table
+    if 0 <= address <= 0xFF:
+        reg = _REGISTER_TABLE[address]
+        if reg is not None:
+            return reg
+    raise KeyError(f"Unknown register address: {address:#04x}")
 
 
 def get_register_32bit(name: str) -> Register32:
@@ -526,9 +671,10 @@ def get_register_32bit(name: str) -> Register32:
     Raises:
         KeyError: If register not found
     """
-    if name not in REGISTERS_32BIT_BY_NAME:
+    reg = _REGISTERS_32BIT_BY_NAME.get(name)
+    if reg is None:
         raise KeyError(f"Unknown 32-bit register: {name!r}")
-    return REGISTERS_32BIT_BY_NAME[name]
+    return reg
 
 
 def get_all_registers(reg_type: RegisterType | None = None) -> list[Register]:
@@ -542,7 +688,7 @@ def get_all_registers(reg_type: RegisterType | None = None) -> list[Register]:
     """
     if reg_type is None:
         return list(_REGISTERS)
-    return [reg for reg in _REGISTERS if reg.reg_type == reg_type]
+    return list(_REGISTERS_BY_TYPE[reg_type])
 
 
 def get_all_registers_32bit(reg_type: RegisterType | None = None) -> list[Register32]:
@@ -556,7 +702,7 @@ def get_all_registers_32bit(reg_type: RegisterType | None = None) -> list[Regist
     """
     if reg_type is None:
         return list(_REGISTERS_32BIT)
-    return [reg for reg in _REGISTERS_32BIT if reg.reg_type == reg_type]
+    return list(_REGISTERS_32BIT_BY_TYPE[reg_type])
 
 
 def is_mux_register(address: int) -> bool:
@@ -568,8 +714,7 @@ def is_mux_register(address: int) -> bool:
     Returns:
         True if register is a MUX type
     """
-    reg = REGISTERS_BY_ADDRESS.get(address)
-    return reg is not None and reg.reg_type == RegisterType.MUX
+    return address in _MUX_ADDRESSES
 
 
 def is_readonly_register(address: int) -> bool:
@@ -581,8 +726,7 @@ def is_readonly_register(address: int) -> bool:
     Returns:
         True if register is read-only
     """
-    reg = REGISTERS_BY_ADDRESS.get(address)
-    return reg is not None and reg.reg_type == RegisterType.RO
+    return address in _RO_ADDRESSES
 
 
 def is_command_register(address: int) -> bool:
@@ -594,8 +738,35 @@ def is_command_register(address: int) -> bool:
     Returns:
         True if register is a command register
     """
-    reg = REGISTERS_BY_ADDRESS.get(address)
-    return reg is not None and reg.reg_type == RegisterType.CMD
+    return address in _CMD_ADDRESSES
+
+
+def mux_write_pair(reg_name: str, signal_name: str) -> tuple[int, int]:
+    """Get the address and value that route a system bus signal to a MUX.
+
+    Args:
+        reg_name: MUX register name (e.g., 'OUT1_TTL')
+        signal_name: System bus signal name (e.g., 'PC_GATE')
+
+    Returns:
+        (register address, signal index), ready to write
+
+    Raises:
+        KeyError: If the register or signal name is unknown
+        ValueError: If the register is not a MUX register
+
+    >>> mux_write_pair("OUT1_TTL", "PC_GATE")
+    (96, 30)
+    """
+    reg = _REGISTERS_BY_NAME.get(reg_name)
+    if reg is None:
+        raise KeyError(f"Unknown register name: {reg_name!r}")
+    if reg.reg_type is not RegisterType.MUX:
+        raise ValueError(f"Register {reg_name!r} is not a MUX register")
+    index = _SIGNAL_INDICES.get(signal_name)
+    if index is None:
+        raise KeyError(f"Unknown signal name: {signal_name!r}")
+    return reg.address, index
 
 
 # =============================================================================
@@ -154,7 +154,7 @@ class ZebraSimulator:
 
                 # Generate simulated data for each enabled capture bit
                 for bit in range(10):
-                    if (bit_cap >> bit) & 1:
+                    if bit_cap & (1 << bit):
                         # Generate random simulated data
                         if bit < 4:  # Encoders (signed 32-bit)
                             # Simulate encoder position incrementing
@@ -2,11 +2,15 @@
 
 import asyncio
 import logging
+import math
+import threading
+from collections import deque
+from collections.abc import Sequence
 
 try:
-    import aioserial
+    import serial
 except ImportError:
-    aioserial = None  # type: ignore[assignment]
+    serial = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,12 @@ class ZebraTransport:
     asyncio for non-blocking I/O. Handles connection management, line-based
     reading/writing, and proper cleanup.
 
+    Received data is read by a dedicated thread doing blocking reads on the
+    port, so the small kernel serial buffer is serviced even while the event
+    loop is busy (e.g. with EPICS traffic). Complete lines are handed to the
+    event loop with ``call_soon_threadsafe``. Writes are run in a worker
+    thread, so a stalled port cannot block the event loop.
+
     Supports simulation mode: Use port="sim://name" to use software simulator
     instead of real hardware.
 
@@ -29,6 +39,7 @@ class ZebraTransport:
 
     BAUD_RATE = 115200
     TIMEOUT = 1.0
+    RX_POLL_INTERVAL = 0.05  # Reader thread checks for shutdown this often
 
     def __init__(self, port: str):
         """Initialize transport for given serial port.
@@ -39,23 +50,24 @@ class ZebraTransport:
         """
         self.port = port
         self._is_simulation = port.startswith("sim://")
-        self._serial: aioserial.AioSerial | None = None  # type: ignore[name-defined]
+        self._serial: serial.Serial | None = None  # type: ignore[name-defined]
         self._connected = False
 
         # Message routing queues (for real hardware)
         self._response_queue: asyncio.Queue[str] = asyncio.Queue()
         self._interrupt_queue: asyncio.Queue[str] = asyncio.Queue()
-        self._reader_task: asyncio.Task | None = None
+        self._reader_thread: threading.Thread | None = None
+        self._reader_stop = threading.Event()
 
         # Simulation mode components
         self._simulator = None
         self._sim_interrupt_queue: asyncio.Queue[str] | None = None
-        self._sim_last_response: str | None = None
+        self._sim_responses: deque[str] = deque()
 
-        if not self._is_simulation and aioserial is None:
+        if not self._is_simulation and serial is None:
             raise ImportError(
-                "aioserial is required for serial communication. "
-                "Install with: pip install aioserial"
+                "pyserial is required for serial communication. "
+                "Install with: pip install pyserial"
             )
 
     async def connect(self) -> None:
@@ -89,19 +101,28 @@ class ZebraTransport:
         else:
             logger.info(f"Connecting to Zebra on {self.port} at {self.BAUD_RATE} baud")
 
-            self._serial = aioserial.AioSerial(  # type: ignore[union-attr]
-                port=self.port,
+            self._serial = await asyncio.to_thread(
+                serial.serial_for_url,  # type: ignore[union-attr]
+                self.port,
                 baudrate=self.BAUD_RATE,
-                bytesize=aioserial.EIGHTBITS,  # type: ignore[union-attr]
-                parity=aioserial.PARITY_NONE,  # type: ignore[union-attr]
-                stopbits=aioserial.STOPBITS_ONE,  # type: ignore[union-attr]
-                timeout=self.TIMEOUT,
+                bytesize=serial.EIGHTBITS,  # type: ignore[union-attr]
+                parity=serial.PARITY_NONE,  # type: ignore[union-attr]
+                stopbits=serial.STOPBITS_ONE,  # type: ignore[union-attr]
+                timeout=self.RX_POLL_INTERVAL,
+                write_timeout=self.TIMEOUT,
             )
 
             self._connected = True
 
-            # Start background reader task to route messages
-            self._reader_task = asyncio.create_task(self._read_and_route_messages())
+            # Start background reader thread to route messages
+            self._reader_stop.clear()
+            self._reader_thread = threading.Thread(
+                target=self._read_and_route_messages,
+                args=(self._serial, asyncio.get_running_loop()),
+                name=f"zebra-rx-{self.port}",
+                daemon=True,
+            )
+            self._reader_thread.start()
 
             logger.info(f"Connected to Zebra on {self.port}")
 
@@ -117,16 +138,13 @@ class ZebraTransport:
                 self._simulator.reset()
                 self._simulator = None
             self._sim_interrupt_queue = None
-            self._sim_last_response = None
+            self._sim_responses.clear()
         else:
-            # Stop reader task
-            if self._reader_task:
-                self._reader_task.cancel()
-                try:
-                    await self._reader_task
-                except asyncio.CancelledError:
-                    pass
-                self._reader_task = None
+            # Stop reader thread (it polls the stop flag every RX_POLL_INTERVAL)
+            self._reader_stop.set()
+            if self._reader_thread:
+                await asyncio.to_thread(self._reader_thread.join)
+                self._reader_thread = None
 
             if self._serial:
                 self._serial.close()
@@ -143,43 +161,78 @@ class ZebraTransport:
         else:
             return self._connected and self._serial is not None
 
-    async def _read_and_route_messages(self) -> None:
-        """Background task to read from serial and route messages to queues.
+    def _read_and_route_messages(
+        self,
+        port: "serial.Serial",  # type: ignore[name-defined]
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Reader thread: read from serial and pass lines to the event loop.
 
-        Routes messages based on first character:
-        - Messages starting with 'P' go to interrupt queue
-        - All other messages go to response queue
+        Reads everything currently waiting on the port in one go and splits
+        it into lines, so a burst of N messages costs one event loop callback
+        rather than N.
+
+        Args:
+            port: Open serial port to read from
+            loop: Event loop that owns the message queues
         """
-        try:
-            while self._connected and self._serial:
-                try:
-                    # Read line from serial port (blocking)
-                    line_bytes = await self._serial.readline_async()  # type: ignore[union-attr]
-
-                    # Decode and strip newline
-                    line = line_bytes.decode("ascii").rstrip("\r\n")
-
-                    if not line:  # Empty line, skip
-                        continue
-
-                    # Route based on message type
-                    if line.startswith("P"):
-                        # Interrupt message
-                        logger.debug(f"RX (interrupt): {line!r}")
-                        await self._interrupt_queue.put(line)
-                    else:
-                        # Command response
-                        logger.debug(f"RX: {line!r}")
-                        await self._response_queue.put(line)
-
-                except Exception as e:
-                    if self._connected:
-                        logger.error(f"Error in reader task: {e}")
-                    break
-
-        except asyncio.CancelledError:
-            logger.debug("Reader task cancelled")
-            raise
+        buffer = bytearray()
+        while not self._reader_stop.is_set():
+            try:
+                # Blocks for at most RX_POLL_INTERVAL when nothing is waiting
+                chunk = port.read(port.in_waiting or 1)
+            except Exception as e:
+                if not self._reader_stop.is_set():
+                    logger.error(f"Error in reader thread: {e}")
+                break
+
+            if not chunk:
+                continue
+
+            buffer += chunk
+            end = buffer.rfind(b"\n")
+            if end < 0:  # No complete line yet
+                continue
+
+            # Decode the whole batch once, off the event loop, rather than
+            # each line separately. Line noise must not kill the thread.
+            lines = buffer[:end].decode("ascii", errors="replace").split("\n")
+            del buffer[: end + 1]
+
+            try:
+                loop.call_soon_threadsafe(self._route_lines, lines)
+            except RuntimeError:  # Event loop closed
+                break
+
+        logger.debug("Reader thread stopped")
+
+    def _route_lines(self, lines: list[str]) -> None:
+        """Route lines received by the reader thread. Runs in the event loop.
+
+        Args:
+            lines: Decoded lines without newline terminators
+        """
+        for line in lines:
+            self._route_line(line.rstrip("\r"))
+
+    def _route_line(self, line: str) -> None:
+        """Route a received line to the interrupt or response queue.
+
+        Args:
+            line: Received line without terminator
+        """
+        if not line:  # Empty line, skip
+            return
+
+        # Route based on message type (first character)
+        if line[0] == "P":
+            # Interrupt message
+            logger.debug("RX (interrupt): %r", line)
+            self._interrupt_queue.put_nowait(line)
+        else:
+            # Command response
+            logger.debug("RX: %r", line)
+            self._response_queue.put_nowait(line)
 
     async def write_line(self, data: str) -> None:
         """Write a line of text to the Zebra or simulator.
@@ -195,28 +248,75 @@ class ZebraTransport:
         if not self.connected:
             raise RuntimeError("Not connected to Zebra")
 
-        logger.debug(f"TX: {data!r}")
+        logger.debug("TX: %r", data)
 
         if self._is_simulation:
-            # Process command and store response for next read_line
+            # Process command and queue response for read_line
             if self._simulator:
                 response = await self._simulator.process_command(data)
-                # Store response to be returned by next read_line() call
-                self._sim_last_response = response
+                self._sim_responses.append(response)
         else:
-            line = data + "\n"
-            await self._serial.write_async(  # type: ignore[union-attr]
-                line.encode("ascii")
-            )
+            await self._write((data + "\n").encode("ascii"))
+
+    async def write_lines(self, lines: Sequence[str]) -> None:
+        """Write several lines of text to the Zebra or simulator at once.
+
+        The lines are sent in a single write, so the Zebra can process them
+        back to back. Responses are read with read_line, in order.
+
+        Args:
+            lines: ASCII text commands (without newlines)
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to Zebra")
+
+        if self._is_simulation:
+            for line in lines:
+                await self.write_line(line)
+        else:
+            logger.debug("TX: %r", lines)
+            data = "".join(f"{line}\n" for line in lines)
+            await self._write(data.encode("ascii"))
+
+    async def _write(self, data: bytes) -> None:
+        """Write bytes to the serial port without blocking the event loop.
+
+        pyserial writes block until the data is queued, for up to TIMEOUT if
+        the port stalls, so they run in a worker thread.
+
+        Args:
+            data: Encoded data to write
+        """
+        await asyncio.to_thread(self._serial.write, data)  # type: ignore[union-attr]
+
+    def _wait_timeout(self, timeout: float | None) -> float | None:
+        """Convert a read timeout to the form taken by asyncio.wait_for.
+
+        Args:
+            timeout: Read timeout in seconds, None for the default, or math.inf
+                to wait indefinitely
+
+        Returns:
+            Timeout in seconds, or None to wait indefinitely
+        """
+        if timeout is None:
+            return self.TIMEOUT
+        if math.isinf(timeout):
+            return None
+        return timeout
 
     async def read_line(self, timeout: float | None = None) -> str:
         """Read a line of text from the Zebra or simulator.
 
         Reads until newline terminator, which is stripped from result.
-        In simulation mode, returns the last command response.
+        In simulation mode, returns the oldest unread command response.
 
         Args:
-            timeout: Read timeout in seconds (uses default if None)
+            timeout: Read timeout in seconds (uses default if None), or
+                math.inf to wait indefinitely
 
         Returns:
             Received line without newline terminator
@@ -228,22 +328,20 @@ class ZebraTransport:
         if not self.connected:
             raise RuntimeError("Not connected to Zebra")
 
-        if timeout is None:
-            timeout = self.TIMEOUT
+        timeout = self._wait_timeout(timeout)
 
         try:
             if self._is_simulation:
-                # Return the stored response from last write_line
-                if self._sim_last_response is not None:
-                    line = self._sim_last_response
-                    self._sim_last_response = None
-                    logger.debug(f"RX: {line!r}")
+                # Return the oldest response queued by write_line
+                if self._sim_responses:
+                    line = self._sim_responses.popleft()
+                    logger.debug("RX: %r", line)
                 else:
                     raise RuntimeError(
                         "No response available - write_line must be called first"
                     )
             else:
-                # Read from response queue (populated by reader task)
+                # Read from response queue (populated by reader thread)
                 line = await asyncio.wait_for(
                     self._response_queue.get(),
                     timeout=timeout,
@@ -263,7 +361,8 @@ class ZebraTransport:
         On real hardware, reads any available line.
 
         Args:
-            timeout: Read timeout in seconds (uses default if None)
+            timeout: Read timeout in seconds (uses default if None), or
+                math.inf to wait indefinitely
 
         Returns:
             Interrupt message without newline terminator
@@ -275,8 +374,7 @@ class ZebraTransport:
         if not self.connected:
             raise RuntimeError("Not connected to Zebra")
 
-        if timeout is None:
-            timeout = self.TIMEOUT
+        timeout = self._wait_timeout(timeout)
 
         try:
             if self._is_simulation:
@@ -285,11 +383,11 @@ class ZebraTransport:
                     line = await asyncio.wait_for(
                         self._sim_interrupt_queue.get(), timeout=timeout
                     )
-                    logger.debug(f"RX (interrupt): {line!r}")
+                    logger.debug("RX (interrupt): %r", line)
                 else:
                     raise RuntimeError("Simulator not properly initialized")
             else:
-                # Read from interrupt queue (populated by reader task)
+                # Read from interrupt queue (populated by reader thread)
                 line = await asyncio.wait_for(
                     self._interrupt_queue.get(),
                     timeout=timeout,
@@ -301,6 +399,34 @@ class ZebraTransport:
             # Timeouts are normal for interrupt monitoring
             raise
 
+    async def read_interrupts(self, timeout: float | None = None) -> list[str]:
+        """Read all pending interrupt messages.
+
+        Waits for the first interrupt message, then drains any further
+        messages that are already queued so that a burst of position compare
+        data is handled in a single wakeup.
+
+        Args:
+            timeout: Read timeout in seconds (uses default if None), or
+                math.inf to wait indefinitely
+
+        Returns:
+            Interrupt messages without newline terminators, oldest first
+
+        Raises:
+            RuntimeError: If not connected
+            TimeoutError: If no message arrives before the timeout
+        """
+        messages = [await self.read_interrupt(timeout)]
+
+        queue = (
+            self._sim_interrupt_queue if self._is_simulation else self._interrupt_queue
+        )
+        while queue is not None and not queue.empty():
+            messages.append(queue.get_nowait())
+
+        return messages
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.connect()
@@ -3,7 +3,7 @@
 Provides EPICS PVs for controlling and monitoring the Zebra position compare
 and logic hardware through the serial protocol layer.
 
-Phase 3 implements the full controller hierarchy:
+The controller hierarchy covers:
 - AND gates (AND1-4)
 - OR gates (OR1-4)
 - Gate generators (GATE1-4)
@@ -15,19 +15,26 @@ Phase 3 implements the full controller hierarchy:
 
 import asyncio
 import logging
+import math
 
 from fastcs.attributes import AttrR, AttrRW
 from fastcs.controllers import Controller
-from fastcs.datatypes import Bool, Int, String
 from fastcs.methods import command, scan
 from fastcs.util import ONCE
 
+from .controllers._datatypes import BOOL, INT, STRING
+from .controllers._status_bits import (
+    ALL_STATUS_BITS,
+    pack_status,
+    set_bit_indices,
+)
 from .controllers.dividers import DividerController
 from .controllers.gates import GateController
 from .controllers.logic import AndGateController, OrGateController
 from .controllers.outputs import OutputController
 from .controllers.position_compare import PositionCompareController
 from .controllers.pulses import PulseController
+from .controllers.sub_controller import ZebraSubcontroller
 from .interrupts import InterruptHandler, PositionCompareData
 from .protocol import ZebraProtocol
 from .register_io import ZebraRegisterIO, ZebraRegisterIORef
@@ -36,6 +43,13 @@ from .transport import ZebraTransport
 
 logger = logging.getLogger(__name__)
 
+
+# (attribute name, group) for each system bus bit, by signal index
+_SYSBUS_ATTRS = tuple(
+    (signal.name.replace("_", ""), "SysBus2" if signal.value >= 32 else "SysBus1")
+    for signal in SysBus
+)
+
 # Re-export for backward compatibility
 __all__ = ["ZebraController", "ZebraRegisterIO", "ZebraRegisterIORef"]
 
@@ -84,7 +98,6 @@ class ZebraController(Controller):
         self._interrupt_handler = InterruptHandler()
         self._interrupt_task: asyncio.Task | None = None
         self._callbacks_registered = False
-        self._sys_stat_update_task: asyncio.Task | None = None
 
         # Create IO handler (will be set to actual protocol after connect)
         self._register_io = ZebraRegisterIO(None)
@@ -96,22 +109,22 @@ class ZebraController(Controller):
         # =====================================================================
 
         # Connection status (no IO, updated manually)
-        self.connected = AttrR(Bool())
+        self.connected = AttrR(BOOL)
 
         # Firmware version (register 0xF0)
         self.sys_ver = AttrR(
-            Int(), io_ref=ZebraRegisterIORef(register=0xF0, update_period=ONCE)
+            INT, io_ref=ZebraRegisterIORef.get(0xF0, update_period=ONCE)
         )
 
         # System state/error (register 0xF1)
         self.sys_staterr = AttrR(
-            Int(),
-            io_ref=ZebraRegisterIORef(register=0xF1, update_period=ONCE),
+            INT,
+            io_ref=ZebraRegisterIORef.get(0xF1, update_period=ONCE),
         )
 
         # System bus status (32-bit registers)
-        self.sys_stat1 = AttrR(Int())
-        self.sys_stat2 = AttrR(Int())
+        self.sys_stat1 = AttrR(INT)
+        self.sys_stat2 = AttrR(INT)
 
         # =====================================================================
         # System Bus Individual Bits (derived from sys_stat1/2)
@@ -120,68 +133,67 @@ class ZebraController(Controller):
         # sysbus1: bits 0-31 from sys_stat1
         # sysbus2: bits 32-63 from sys_stat2
         self.sysbit_attrs: list[str] = []
-        for signal in SysBus:
-            attr_name = signal.name.replace("_", "")
+        # Bit attribute for each signal, by signal index (= status bit)
+        self._sysbus_attrs: list[AttrR] = []
+        for attr_name, group in _SYSBUS_ATTRS:
             self.sysbit_attrs.append(attr_name)
-            if signal.value >= 32:
-                setattr(self, attr_name, AttrR(Bool(), group="SysBus2"))
-            else:
-                setattr(self, attr_name, AttrR(Bool(), group="SysBus1"))
+            attr = AttrR(BOOL, group=group)
+            setattr(self, attr_name, attr)
+            self._sysbus_attrs.append(attr)
+        # Last packed status, None until the first poll updates every bit
+        self._last_sys_stat: int | None = None
 
         # Number of position compare captures (registers 0xF6/0xF7)
         # Kept for backward compatibility
         self.pc_num_cap = AttrR(
-            Int(),
-            io_ref=ZebraRegisterIORef(
-                register=0xF6,
-                is_32bit=True,
-                register_hi=0xF7,
-                update_period=ONCE,
+            INT,
+            io_ref=ZebraRegisterIORef.get(
+                0xF6, is_32bit=True, register_hi=0xF7, update_period=ONCE
             ),
         )
 
         # Position compare encoder selection (register 0x88)
         # Kept for backward compatibility
         self.pc_enc = AttrRW(
-            Int(),
-            io_ref=ZebraRegisterIORef(register=0x88, update_period=ONCE),
+            INT,
+            io_ref=ZebraRegisterIORef.get(0x88, update_period=ONCE),
         )
 
         # Position compare timestamp prescaler (register 0x89)
         # Kept for backward compatibility
         self.pc_tspre = AttrRW(
-            Int(),
-            io_ref=ZebraRegisterIORef(register=0x89, update_period=ONCE),
+            INT,
+            io_ref=ZebraRegisterIORef.get(0x89, update_period=ONCE),
         )
 
         # Soft inputs (register 0x7F)
         self.soft_in = AttrRW(
-            Int(),
-            io_ref=ZebraRegisterIORef(register=0x7F, update_period=ONCE),
+            INT,
+            io_ref=ZebraRegisterIORef.get(0x7F, update_period=ONCE),
         )
 
         # Divider first pulse behavior (register 0x7C)
         self.div_first = AttrRW(
-            Int(),
-            io_ref=ZebraRegisterIORef(register=0x7C, update_period=ONCE),
+            INT,
+            io_ref=ZebraRegisterIORef.get(0x7C, update_period=ONCE),
         )
 
         # Output polarity control (register 0x54)
         self.polarity = AttrRW(
-            Int(),
-            io_ref=ZebraRegisterIORef(register=0x54, update_period=ONCE),
+            INT,
+            io_ref=ZebraRegisterIORef.get(0x54, update_period=ONCE),
         )
 
         # Last captured position compare data (updated via interrupts, no IO)
         # Kept for backward compatibility
-        self.pc_time_last = AttrR(Int())
-        self.pc_enc1_last = AttrR(Int())
-        self.pc_enc2_last = AttrR(Int())
-        self.pc_enc3_last = AttrR(Int())
-        self.pc_enc4_last = AttrR(Int())
+        self.pc_time_last = AttrR(INT)
+        self.pc_enc1_last = AttrR(INT)
+        self.pc_enc2_last = AttrR(INT)
+        self.pc_enc3_last = AttrR(INT)
+        self.pc_enc4_last = AttrR(INT)
 
         # Status message (no IO)
-        self.status_msg = AttrR(String())
+        self.status_msg = AttrR(STRING)
 
         # =====================================================================
         # Sub-controllers
@@ -230,6 +242,17 @@ class ZebraController(Controller):
         # Position compare subsystem
         self.pc = PositionCompareController(self._register_io)
 
+        # Attributes to update for each system bus bit, by signal index: the
+        # bit attribute itself plus the outputs of every registered
+        # sub-controller on that signal
+        status_attrs = [[attr] for attr in self._sysbus_attrs]
+        for controller in self.sub_controllers.values():
+            if not isinstance(controller, ZebraSubcontroller):
+                continue
+            for index, attr in controller.status_outputs:
+                status_attrs[index].append(attr)
+        self._status_attrs = tuple(tuple(attrs) for attrs in status_attrs)
+
         # Register interrupt handler with PC controller so it gets bit_cap updates
         self.pc.register_interrupt_handler(self._interrupt_handler)
 
@@ -243,6 +266,9 @@ class ZebraController(Controller):
             # Update the IO handler with the actual protocol
             self._register_io.set_protocol(self.__protocol)
 
+            # Publish every system bus bit on the first poll of this connection
+            self._last_sys_stat = None
+
             # Update connection status
             await self.connected.update(True)
             await self.status_msg.update("Connected")
@@ -275,8 +301,6 @@ class ZebraController(Controller):
     async def disconnect(self) -> None:
         """Disconnect from Zebra hardware."""
         # Cancel background tasks
-        # (sys_stat_update_task removed - using callbacks instead)
-
         if self._interrupt_task:
             self._interrupt_task.cancel()
             try:
@@ -290,6 +314,9 @@ class ZebraController(Controller):
             self._transport = None
             self.__protocol = None
 
+        # Refresh every system bus bit on the next connection
+        self._last_sys_stat = None
+
         await self.connected.update(False)
         logger.info("Disconnected from Zebra")
         await self.status_msg.update("Disconnected")
@@ -304,27 +331,23 @@ class ZebraController(Controller):
 
         @self._interrupt_handler.on_data
         async def on_data(data: PositionCompareData):
-            # Update last captured values (top-level for backward compatibility)
-            await self.pc_time_last.update(data.timestamp)
-            if data.encoder1 is not None:
-                await self.pc_enc1_last.update(data.encoder1)
-            if data.encoder2 is not None:
-                await self.pc_enc2_last.update(data.encoder2)
-            if data.encoder3 is not None:
-                await self.pc_enc3_last.update(data.encoder3)
-            if data.encoder4 is not None:
-                await self.pc_enc4_last.update(data.encoder4)
-
-            # Also update position compare controller
-            await self.pc.time_last.update(data.timestamp)
-            if data.encoder1 is not None:
-                await self.pc.enc1_last.update(data.encoder1)
-            if data.encoder2 is not None:
-                await self.pc.enc2_last.update(data.encoder2)
-            if data.encoder3 is not None:
-                await self.pc.enc3_last.update(data.encoder3)
-            if data.encoder4 is not None:
-                await self.pc.enc4_last.update(data.encoder4)
+            # Update last captured values at the top level (for backward
+            # compatibility) and on the position compare controller. The
+            # mirrors are independent, so update them concurrently.
+            updates = [
+                self.pc_time_last.update(data.timestamp),
+                self.pc.time_last.update(data.timestamp),
+            ]
+            for value, top_attr, pc_attr in (
+                (data.encoder1, self.pc_enc1_last, self.pc.enc1_last),
+                (data.encoder2, self.pc_enc2_last, self.pc.enc2_last),
+                (data.encoder3, self.pc_enc3_last, self.pc.enc3_last),
+                (data.encoder4, self.pc_enc4_last, self.pc.enc4_last),
+            ):
+                if value is not None:
+                    updates.append(top_attr.update(value))
+                    updates.append(pc_attr.update(value))
+            await asyncio.gather(*updates)
 
         @self._interrupt_handler.on_end
         async def on_end():
@@ -336,18 +359,18 @@ class ZebraController(Controller):
         try:
             while self._transport and self._transport.connected:
                 try:
-                    # Try to read interrupt with short timeout
-                    message = await self._transport.read_interrupt(timeout=0.1)
-
-                    # Check if it's an interrupt
-                    if message.startswith("P"):
-                        await self._interrupt_handler.handle_message(message)
-                    else:
-                        logger.warning(f"Unexpected message: {message!r}")
-
-                except TimeoutError:
-                    # No data available, continue
-                    await asyncio.sleep(0.01)
+                    # Park until interrupts arrive, then handle all queued ones
+                    messages = await self._transport.read_interrupts(math.inf)
+
+                    for message in messages:
+                        if not message.startswith("P"):
+                            logger.warning(f"Unexpected message: {message!r}")
+
+                    # Data bursts are decoded together rather than per message.
+                    # Invalid messages are logged and skipped by the handler,
+                    # so one bad line does not drop the rest of the burst.
+                    await self._interrupt_handler.handle_messages(messages)
+
                 except Exception as e:
                     logger.error(f"Error monitoring interrupts: {e}")
                     await asyncio.sleep(0.1)
@@ -403,22 +426,6 @@ class ZebraController(Controller):
         logger.info("System reset")
         await self.status_msg.update("System reset")
 
-    # ,
-    #             io_ref=ZebraRegisterIORef(
-    #                 register=0xF2,
-    #                 is_32bit=True,
-    #                 register_hi=0xF3,
-    #                 update_period=FAST_UPDATE,
-    #             ),
-    #         )
-    #         self.sys_stat2 = AttrR(
-    #             Int(),
-    #             io_ref=ZebraRegisterIORef(
-    #                 register=0xF4,
-    #                 is_32bit=True,
-    #                 register_hi=0xF5,
-    #                 update_period=FAST_UPDATE,
-    #             ),
     @property
     def _protocol(self) -> ZebraProtocol:
         """Get the ZebraProtocol instance.
@@ -434,25 +441,37 @@ class ZebraController(Controller):
     async def on_sys_stat_update(self) -> None:
         """Called when sys_stat1 or sys_stat2 updates."""
         try:
-            sys_stat1 = await self._protocol.read_register_32bit(0xF2, 0xF3)
+            # Read both LO/HI status pairs in a single batch
+            (
+                stat1_lo,
+                stat1_hi,
+                stat2_lo,
+                stat2_hi,
+            ) = await self._protocol.read_registers((0xF2, 0xF3, 0xF4, 0xF5))
+            sys_stat1 = (stat1_hi << 16) | stat1_lo
+            sys_stat2 = (stat2_hi << 16) | stat2_lo
+            status = pack_status(sys_stat1, sys_stat2)
+            if status == self._last_sys_stat:
+                return  # Nothing changed since the last poll
+
             await self.sys_stat1.update(sys_stat1)
-            sys_stat2 = await self._protocol.read_register_32bit(0xF4, 0xF5)
             await self.sys_stat2.update(sys_stat2)
 
-            # Update individual system bus bit attributes in sub-controllers
-            for signal in SysBus:
-                bit_index = signal.value
-
-                attr_name = self.sysbit_attrs[bit_index]
-                attr = getattr(self, attr_name, None)
-                if bit_index < 32:
-                    # Bit is in sys_stat1 -> update sysbus1 controller
-                    bit_value = bool((sys_stat1 >> bit_index) & 1)
-                else:
-                    # Bit is in sys_stat2 -> update sysbus2 controller
-                    bit_value = bool((sys_stat2 >> (bit_index - 32)) & 1)
-                if attr:
-                    await attr.update(bit_value)
+            # Update only the attributes on bits whose value changed
+            if self._last_sys_stat is None:
+                changed = ALL_STATUS_BITS
+            else:
+                changed = status ^ self._last_sys_stat
+            self._last_sys_stat = status
+
+            # Bit attributes and sub-controller outputs on the changed bits,
+            # awaited together rather than one at a time
+            updates = [
+                attr.update(bool(status >> index & 1))
+                for index in set_bit_indices(changed)
+                for attr in self._status_attrs[index]
+            ]
+            await asyncio.gather(*updates)
 
         except Exception as e:
             logger.error(f"Error updating derived values: {e}")
@@ -1,5 +1,9 @@
 """Pytest configuration for fastcs-zebra tests."""
 
+import pytest
+
+from fastcs_zebra.zebra_controller import ZebraController
+
 
 def pytest_addoption(parser):
     """Add command line options for testing."""
@@ -9,3 +13,22 @@ def pytest_addoption(parser):
         default=None,
         help="Zebra serial port (e.g., /dev/ttyUSB0 or /tmp/vserial0)",
     )
+
+
+class StubStatusProtocol:
+    """Protocol stub that returns a fixed SYS_STAT1/2 for status polls."""
+
+    def __init__(self):
+        self.status = 0  # Packed status, bit N is system bus signal N
+
+    async def read_registers(self, addresses):
+        assert tuple(addresses) == (0xF2, 0xF3, 0xF4, 0xF5)
+        return [(self.status >> shift) & 0xFFFF for shift in (0, 16, 32, 48)]
+
+
+@pytest.fixture
+def stub_status(monkeypatch):
+    """Replace the controller protocol with a status stub."""
+    protocol = StubStatusProtocol()
+    monkeypatch.setattr(ZebraController, "_protocol", property(lambda _: protocol))
+    return protocol
@@ -1,9 +1,73 @@
 import subprocess
 import sys
 
+import pytest
+
 from fastcs_zebra import __version__
+from fastcs_zebra.__main__ import _new_event_loop, _parse_args
 
 
 def test_cli_version():
     cmd = [sys.executable, "-m", "fastcs_zebra", "--version"]
     assert subprocess.check_output(cmd).decode().strip() == __version__
+
+
+def test_parse_args_separate_values():
+    parsed = _parse_args(["--port", "/dev/ttyUSB0", "--pv-prefix", "BL99I-ZEBRA"])
+    assert parsed.port == "/dev/ttyUSB0"
+    assert parsed.pv_prefix == "BL99I-ZEBRA"
+    assert parsed.log_level == "INFO"
+    assert parsed.gui is None
+    assert parsed.no_interactive is False
+
+
+def test_parse_args_equals_values():
+    parsed = _parse_args(
+        [
+            "--port=sim://zebra",
+            "--log-level=DEBUG",
+            "--gui=zebra.bob",
+            "--no-interactive",
+        ]
+    )
+    assert parsed.port == "sim://zebra"
+    assert parsed.log_level == "DEBUG"
+    assert parsed.gui == "zebra.bob"
+    assert parsed.no_interactive is True
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["--port"], "argument --port: expected one argument"),
+        (["--port", "--pv-prefix"], "argument --port: expected one argument"),
+        (["--port", "sim://zebra", "--bogus"], "unrecognized arguments: --bogus"),
+        (["--port", "sim://zebra", "--log-level", "LOUD"], "invalid choice: 'LOUD'"),
+        ([], "the following arguments are required: --port"),
+    ],
+)
+def test_parse_args_errors(capsys, args, message):
+    with pytest.raises(SystemExit) as exc_info:
+        _parse_args(args)
+    assert exc_info.value.code == 2
+    stderr = capsys.readouterr().err
+    assert stderr.startswith("usage: ")
+    assert message in stderr
+
+
+def test_parse_args_help(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        _parse_args(["--port", "sim://zebra", "--help"])
+    assert exc_info.value.code == 0
+    stdout = capsys.readouterr().out
+    assert stdout.startswith("usage: ")
+    assert "--log-level {DEBUG,INFO,WARNING,ERROR,CRITICAL}" in stdout
+
+
+def test_new_event_loop_uses_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+    loop = _new_event_loop()
+    try:
+        assert isinstance(loop, uvloop.Loop)
+    finally:
+        loop.close()
@@ -12,6 +12,7 @@ import asyncio
 
 import pytest
 
+from fastcs_zebra.registers import SysBus
 from fastcs_zebra.zebra_controller import ZebraController
 
 
@@ -233,3 +234,105 @@ async def test_sys_reset_command(zebra_controller):
     # Check status message was updated
     status = zebra_controller.status_msg.get()
     assert "reset" in status.lower() or "Reset" in status
+
+
+# System bus status tests
+
+
+def test_status_attrs_include_sub_controller_outputs():
+    """Test that every sub-controller output is updated from its status bit."""
+    controller = ZebraController("sim://zebra")
+    outputs = [
+        output
+        for sub_controller in controller.sub_controllers.values()
+        for output in getattr(sub_controller, "status_outputs", ())
+    ]
+    assert outputs
+    for index, attr in outputs:
+        assert any(a is attr for a in controller._status_attrs[index])
+
+
+def record_updates(attrs):
+    """Return a list that collects each attribute as it is updated."""
+    updated = []
+    for attr in attrs:
+
+        async def on_update(_value, attr=attr):
+            updated.append(attr)
+
+        attr.add_on_update_callback(on_update, always=True)
+    return updated
+
+
+def status_attrs(controller, index):
+    """All attributes updated from one system bus bit."""
+    return list(controller._status_attrs[index])
+
+
+async def test_sys_stat_first_poll_updates_all_bits(stub_status):
+    """Test that the first poll publishes every bit, set or not."""
+    controller = ZebraController("sim://zebra")
+    all_attrs = [attr for attrs in controller._status_attrs for attr in attrs]
+    updated = record_updates(all_attrs)
+    stub_status.status = 1 << SysBus.AND1.value
+
+    await controller.on_sys_stat_update()
+
+    assert len(updated) == len(all_attrs)
+    assert controller.sys_stat1.get() == 0
+    assert controller.sys_stat2.get() == 1 << (SysBus.AND1.value - 32)
+    assert controller.and1.out.get() is True
+    assert controller.or1.out.get() is False
+
+
+async def test_sys_stat_poll_updates_only_changed_bits(stub_status):
+    """Test that later polls update only the attributes on changed bits."""
+    controller = ZebraController("sim://zebra")
+    stub_status.status = 1 << SysBus.AND1.value
+    await controller.on_sys_stat_update()
+
+    all_attrs = [attr for attrs in controller._status_attrs for attr in attrs]
+    updated = record_updates(all_attrs)
+    stub_status.status = 1 << SysBus.PULSE1.value
+    await controller.on_sys_stat_update()
+
+    expected = status_attrs(controller, SysBus.AND1.value) + status_attrs(
+        controller, SysBus.PULSE1.value
+    )
+    assert sorted(map(id, updated)) == sorted(map(id, expected))
+    assert controller.and1.out.get() is False
+    assert controller.pulse1.out.get() is True
+    assert controller.sys_stat2.get() == 1 << (SysBus.PULSE1.value - 32)
+
+
+async def test_sys_stat_unchanged_poll_updates_nothing(stub_status):
+    """Test that a poll with no change updates no attributes."""
+    controller = ZebraController("sim://zebra")
+    stub_status.status = 1 << SysBus.AND1.value
+    await controller.on_sys_stat_update()
+
+    updated = record_updates(
+        [controller.sys_stat1, controller.sys_stat2, controller.and1.out]
+    )
+    await controller.on_sys_stat_update()
+    assert updated == []
+
+
+async def test_sys_stat_published_after_reconnect(stub_status):
+    """Test that the first poll after a reconnect publishes unchanged status."""
+    controller = ZebraController("sim://zebra")
+    controller.post_initialise()
+    await controller.connect()
+    stub_status.status = 1 << SysBus.AND1.value
+    await controller.on_sys_stat_update()
+
+    await controller.disconnect()
+    await controller.connect()
+    try:
+        updated = record_updates(
+            [controller.sys_stat1, controller.sys_stat2, controller.and1.out]
+        )
+        await controller.on_sys_stat_update()
+        assert len(updated) == 3
+    finally:
+        await controller.disconnect()
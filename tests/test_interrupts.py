@@ -0,0 +1,208 @@
+"""Unit tests for Zebra interrupt message handling.
+
+Tests cover:
+- Reset, end and data message dispatch
+- Data field parsing for different PC_BIT_CAP values
+- Columnar buffering of captured data
+"""
+
+import pytest
+
+from fastcs_zebra.interrupts import (
+    InterruptHandler,
+    PositionCompareBuffer,
+    PositionCompareData,
+)
+
+# =============================================================================
+# Message Parsing Tests
+# =============================================================================
+
+
+class TestInterruptHandler:
+    """Tests for InterruptHandler message parsing and dispatch."""
+
+    async def test_reset_and_end_dispatch(self):
+        """Test that PR and PX call the reset and end callbacks."""
+        handler = InterruptHandler()
+        events = []
+
+        @handler.on_reset
+        async def on_reset():
+            events.append("reset")
+
+        @handler.on_end
+        async def on_end():
+            events.append("end")
+
+        assert await handler.handle_message("PR")
+        assert await handler.handle_message("PX")
+        assert events == ["reset", "end"]
+
+    async def test_callback_error_isolated(self):
+        """Test that a failing callback does not stop the others."""
+        handler = InterruptHandler()
+        events = []
+
+        @handler.on_reset
+        async def failing():
+            raise RuntimeError("boom")
+
+        @handler.on_reset
+        async def on_reset():
+            events.append("reset")
+
+        assert await handler.handle_message("PR")
+        assert events == ["reset"]
+
+    async def test_non_interrupt_ignored(self):
+        """Test that non-P messages are not handled."""
+        handler = InterruptHandler()
+        assert not await handler.handle_message("R880001")
+
+    async def test_data_fields_parsed(self):
+        """Test parsing timestamp, signed encoders and unsigned fields."""
+        handler = InterruptHandler(bit_cap=0b0000010011)  # enc1, enc2, sysbus1
+        received: list[PositionCompareData] = []
+
+        @handler.on_data
+        async def on_data(data: PositionCompareData):
+            received.append(data)
+
+        await handler.handle_message("P00000010" + "FFFFFFFF" + "00000005" + "80000000")
+
+        (data,) = received
+        assert data.timestamp == 0x10
+        assert data.encoder1 == -1
+        assert data.encoder2 == 5
+        assert data.encoder3 is None
+        assert data.sysbus1 == 0x80000000
+
+    async def test_invalid_timestamp(self):
+        """Test that a malformed timestamp raises ValueError."""
+        handler = InterruptHandler()
+        for message in ("PXYZ", "P0000001G", "P+0000001"):
+            with pytest.raises(ValueError, match="Invalid interrupt message"):
+                await handler.handle_message(message)
+
+    async def test_data_length_mismatch(self):
+        """Test that data not matching PC_BIT_CAP raises ValueError."""
+        handler = InterruptHandler(bit_cap=0b11)
+        with pytest.raises(ValueError, match="Data length mismatch"):
+            await handler.handle_message("P00000010" + "00000001")
+
+
+# =============================================================================
+# Buffer Tests
+# =============================================================================
+
+
+class TestPositionCompareBuffer:
+    """Tests for PositionCompareBuffer."""
+
+    def test_append_fills_enabled_columns(self):
+        """Test that only fields present in the data are stored."""
+        buffer = PositionCompareBuffer()
+        buffer.append(PositionCompareData(timestamp=1, encoder1=-7))
+        buffer.append(PositionCompareData(timestamp=2, encoder1=8))
+
+        assert len(buffer) == 2
+        assert list(buffer.timestamp) == [1, 2]
+        assert list(buffer.encoder1) == [-7, 8]
+        assert len(buffer.encoder2) == 0
+
+    async def test_handle_messages_batch(self):
+        """Test that a burst of messages is dispatched in order."""
+        handler = InterruptHandler(bit_cap=0b1)
+        buffer = PositionCompareBuffer()
+        buffer.attach(handler)
+        ends = []
+
+        @handler.on_end
+        async def on_end():
+            ends.append(len(buffer))
+
+        await handler.handle_messages(
+            ["PR"] + [f"P{ts:08X}{-ts & 0xFFFFFFFF:08X}" for ts in range(3)] + ["PX"]
+        )
+        assert list(buffer.timestamp) == [0, 1, 2]
+        assert list(buffer.encoder1) == [0, -1, -2]
+        assert ends == [3]
+
+    async def test_handle_messages_invalid(self):
+        """Test that an invalid message is skipped and the rest dispatched."""
+        handler = InterruptHandler(bit_cap=0b1)
+        buffer = PositionCompareBuffer()
+        buffer.attach(handler)
+
+        await handler.handle_messages(
+            ["P0000000100000001", "P00000002000000XY", "P0000000300000003"]
+        )
+        assert list(buffer.timestamp) == [1, 3]
+
+    def test_parse_data_messages_rejects_whitespace(self):
+        """Test that whitespace cannot shift rows when decoding a batch."""
+        handler = InterruptHandler(bit_cap=0b1)
+        # Each of these decodes to 4 bytes too few, together a whole row
+        messages = [
+            "P0000000100000001",
+            "P00000002" + " " * 8,
+            "P00000003" + " " * 8,
+            "P0000000400000004",
+        ]
+        with pytest.raises(ValueError, match="Invalid data message"):
+            handler.parse_data_messages(messages)
+
+    async def test_handle_messages_whitespace(self):
+        """Test that batch handling skips only the messages with whitespace."""
+        handler = InterruptHandler(bit_cap=0b1)
+        buffer = PositionCompareBuffer()
+        buffer.attach(handler)
+
+        await handler.handle_messages(
+            [
+                "P0000000100000001",
+                "P00000002" + " " * 8,
+                "P00000003" + " " * 8,
+                "P0000000400000004",
+            ]
+        )
+        assert list(buffer.timestamp) == [1, 4]
+        assert list(buffer.encoder1) == [1, 4]
+
+    async def test_handle_messages_invalid_before_end(self):
+        """Test that PX after an invalid message still reaches callbacks."""
+        handler = InterruptHandler(bit_cap=0b1)
+        buffer = PositionCompareBuffer()
+        buffer.attach(handler)
+        ends = []
+
+        @handler.on_end
+        async def on_end():
+            ends.append(len(buffer))
+
+        await handler.handle_messages(
+            [
+                "PR",
+                "P0000000100000001",
+                "P0000000200000002",
+                "Pgarbage",
+                "P0000000300000003",
+                "PX",
+            ]
+        )
+        assert list(buffer.timestamp) == [1, 2, 3]
+        assert ends == [3]
+
+    async def test_attach_records_acquisition(self):
+        """Test that an attached buffer clears on PR and records data."""
+        handler = InterruptHandler(bit_cap=0b1)
+        buffer = PositionCompareBuffer()
+        buffer.attach(handler)
+
+        await handler.handle_message("PR")
+        await handler.handle_message("P00000001" + "00000002")
+        assert list(buffer.encoder1) == [2]
+
+        await handler.handle_message("PR")
+        assert len(buffer) == 0
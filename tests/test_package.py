@@ -0,0 +1,46 @@
+"""Unit tests for the top level package.
+
+Tests cover:
+- Lazy import of the public API
+- Importing the package without pulling in FastCS
+"""
+
+import subprocess
+import sys
+
+import fastcs_zebra
+
+
+class TestLazyImports:
+    """Tests for names imported on first access."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ can be imported from the package."""
+        for name in fastcs_zebra.__all__:
+            value = getattr(fastcs_zebra, name)
+            assert value is not None, name
+
+    def test_names_come_from_package(self):
+        """Test that lazily imported classes and functions are defined here."""
+        for name in fastcs_zebra.__all__:
+            module = getattr(getattr(fastcs_zebra, name), "__module__", None)
+            if module is not None:
+                assert module.startswith("fastcs_zebra."), name
+
+    def test_dir_lists_all_names(self):
+        """Test that dir() includes names that have not been imported yet."""
+        assert set(fastcs_zebra.__all__) <= set(dir(fastcs_zebra))
+
+    def test_unknown_name(self):
+        """Test that unknown names raise AttributeError."""
+        assert not hasattr(fastcs_zebra, "NotAName")
+
+    def test_import_does_not_import_fastcs(self):
+        """Test that importing the package leaves FastCS unimported."""
+        code = (
+            "import sys, fastcs_zebra; "
+            "assert 'fastcs' not in sys.modules, 'fastcs imported'; "
+            "fastcs_zebra.ZebraController; "
+            "assert 'fastcs' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,273 @@
+"""Unit tests for the Zebra serial protocol.
+
+Tests cover:
+- Coalescing of concurrent register reads into pipelined batches
+- Error and cancellation handling for batched reads
+- Pipelined LO/HI register pair writes
+- Write verification by read-back
+- Bulk reads of 32-bit LO/HI register pairs
+
+A fake transport answers commands from a register dict, so no serial port
+or simulator is needed.
+"""
+
+import asyncio
+from collections import deque
+
+import pytest
+
+from fastcs_zebra.protocol import RegisterError, ZebraProtocol
+
+
+class FakeTransport:
+    """Transport that answers R and W commands from a dict of registers."""
+
+    def __init__(self, registers: dict[int, int] | None = None):
+        self.registers = dict(registers or {})
+        self.read_errors: set[int] = set()  # Addresses that answer E1R<AA>
+        self.write_errors: set[int] = set()  # Addresses that answer E1W<AA>
+        self.read_only: set[int] = set()  # Addresses that ignore written values
+        self.sent: list[list[str]] = []  # Commands, one list per write
+        self.read_failure: Exception | None = None
+        self.read_gate: asyncio.Event | None = None
+        self._responses: deque[str] = deque()
+
+    async def write_line(self, data: str) -> None:
+        await self.write_lines([data])
+
+    async def write_lines(self, lines) -> None:
+        self.sent.append(list(lines))
+        self._responses.extend(self._respond(line) for line in lines)
+
+    async def read_line(self, timeout: float | None = None) -> str:
+        if self.read_gate is not None:
+            await self.read_gate.wait()
+        if self.read_failure is not None:
+            raise self.read_failure
+        return self._responses.popleft()
+
+    def _respond(self, command: str) -> str:
+        address = int(command[1:3], 16)
+        if command[0] == "R":
+            if address in self.read_errors:
+                return f"E1R{address:02X}"
+            return f"R{address:02X}{self.registers.get(address, 0):04X}"
+        if address in self.write_errors:
+            return f"E1W{address:02X}"
+        if address not in self.read_only:
+            self.registers[address] = int(command[3:], 16)
+        return f"W{address:02X}OK"
+
+
+# =============================================================================
+# Batched Read Tests
+# =============================================================================
+
+
+class TestReadBatching:
+    """Tests for coalescing of register reads."""
+
+    async def test_concurrent_reads_share_batch(self):
+        """Test that concurrent reads go out in one write, duplicates once."""
+        transport = FakeTransport({0x10: 0x1234, 0x11: 0x5678})
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        values = await asyncio.gather(
+            protocol.read_register(0x10),
+            protocol.read_register(0x10),
+            protocol.read_register(0x11),
+        )
+        assert values == [0x1234, 0x1234, 0x5678]
+        assert transport.sent == [["R10", "R11"]]
+
+    async def test_batches_split_at_max_size(self):
+        """Test that more reads than MAX_READ_BATCH are sent in chunks."""
+        transport = FakeTransport({address: address for address in range(40)})
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        values = await protocol.read_registers(range(40))
+        assert values == list(range(40))
+        assert [len(batch) for batch in transport.sent] == [16, 16, 8]
+
+    async def test_register_error_fails_only_its_read(self):
+        """Test that an E1R response fails only the read for that address."""
+        transport = FakeTransport({0x10: 1, 0x11: 2, 0x12: 3})
+        transport.read_errors.add(0x11)
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        results = await asyncio.gather(
+            protocol.read_register(0x10),
+            protocol.read_register(0x11),
+            protocol.read_register(0x12),
+            return_exceptions=True,
+        )
+        assert results[0] == 1
+        assert isinstance(results[1], RegisterError)
+        assert results[2] == 3
+
+    async def test_transport_failure_fails_all_reads(self):
+        """Test that a transport error fails every read in the batch."""
+        transport = FakeTransport()
+        transport.read_failure = TimeoutError("no response")
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        results = await asyncio.gather(
+            protocol.read_register(0x10),
+            protocol.read_register(0x11),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, TimeoutError) for result in results)
+
+    async def test_flush_cancelled_during_read(self):
+        """Test that cancelling the flush cancels its reads instead of hanging."""
+        transport = FakeTransport()
+        transport.read_gate = asyncio.Event()  # Never set, so reads block
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        reads = [asyncio.create_task(protocol.read_register(a)) for a in (1, 2)]
+        await asyncio.sleep(0)
+        flush_task = protocol._flush_task
+        assert flush_task is not None
+        await asyncio.sleep(0)  # Let the flush take the batch and start reading
+        flush_task.cancel()
+
+        for read in reads:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(read, timeout=1)
+
+    async def test_flush_cancelled_waiting_for_lock(self):
+        """Test that a flush cancelled before it runs does not block later reads."""
+        transport = FakeTransport({0x10: 7})
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        async with protocol._lock:
+            read = asyncio.create_task(protocol.read_register(0x10))
+            await asyncio.sleep(0)
+            flush_task = protocol._flush_task
+            assert flush_task is not None
+            flush_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(read, timeout=1)
+
+        # A new flush is scheduled for the next read
+        assert await asyncio.wait_for(protocol.read_register(0x10), timeout=1) == 7
+
+
+# =============================================================================
+# Pipelined Write Tests
+# =============================================================================
+
+
+class TestWriteRegisterPair:
+    """Tests for pipelined LO/HI register writes."""
+
+    async def test_pair_written_in_one_batch(self):
+        """Test that both W commands go out together, LO first."""
+        transport = FakeTransport()
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        await protocol.write_register_pair(0x8E, 0x5678, 0x8F, 0x1234)
+        assert transport.sent == [["W8E5678", "W8F1234"]]
+        assert transport.registers == {0x8E: 0x5678, 0x8F: 0x1234}
+
+    async def test_32bit_write_uses_pair(self):
+        """Test that write_register_32bit splits the value into one batch."""
+        transport = FakeTransport()
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        assert await protocol.write_register_32bit(0x38, 0x39, 0xCAFEBABE) == (
+            0xCAFEBABE
+        )
+        assert transport.sent == [["W38BABE", "W39CAFE"]]
+
+    async def test_error_on_second_response(self):
+        """Test that an error on HI raises and leaves no response unread."""
+        transport = FakeTransport({0x10: 0x4321})
+        transport.write_errors.add(0x8F)
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        with pytest.raises(RegisterError, match="0x8f"):
+            await protocol.write_register_pair(0x8E, 1, 0x8F, 2)
+        # Both responses were consumed, so the next read gets its own
+        assert await protocol.read_register(0x10) == 0x4321
+
+    async def test_range_validation(self):
+        """Test that nothing is sent if an address or value is out of range."""
+        transport = FakeTransport()
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="address"):
+            await protocol.write_register_pair(0x8E, 1, 0x100, 2)
+        with pytest.raises(ValueError, match="value"):
+            await protocol.write_register_pair(0x8E, 0x10000, 0x8F, 2)
+        with pytest.raises(ValueError, match="value"):
+            await protocol.write_register_pair(0x8E, 1, 0x8F, -1)
+        assert transport.sent == []
+
+
+# =============================================================================
+# Write Verification Tests
+# =============================================================================
+
+
+class TestWriteVerification:
+    """Tests for optional read-back after register writes."""
+
+    async def test_write_does_not_verify_by_default(self):
+        """Test that a plain write sends no read-back command."""
+        transport = FakeTransport()
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        assert await protocol.write_register(0x10, 0x1234) == 0x1234
+        assert transport.sent == [["W101234"]]
+
+    async def test_write_register_verified_reads_back(self):
+        """Test that a verified write reads the register back."""
+        transport = FakeTransport()
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        assert await protocol.write_register_verified(0x10, 0x1234) == 0x1234
+        assert transport.sent == [["W101234"], ["R10"]]
+
+    async def test_write_register_verified_returns_readback(self):
+        """Test that a verified write returns the value read, not the one sent."""
+        transport = FakeTransport({0x10: 0x0042})
+        transport.read_only.add(0x10)
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        assert await protocol.write_register_verified(0x10, 0x1234) == 0x0042
+
+
+# =============================================================================
+# 32-bit Read Tests
+# =============================================================================
+
+
+class TestRead32Bit:
+    """Tests for reads of 32-bit LO/HI register pairs."""
+
+    async def test_read_registers_32bit_combines_halves(self):
+        """Test that each value is HI << 16 | LO, in the order requested."""
+        transport = FakeTransport(
+            {0x38: 0xBABE, 0x39: 0xCAFE, 0x3A: 0x0001, 0x3B: 0x0000}
+        )
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        values = await protocol.read_registers_32bit([(0x3A, 0x3B), (0x38, 0x39)])
+        assert values == [0x00000001, 0xCAFEBABE]
+        assert transport.sent == [["R3A", "R3B", "R38", "R39"]]
+
+    async def test_read_registers_32bit_chunks(self):
+        """Test that more halves than MAX_READ_BATCH are sent in chunks."""
+        registers = {}
+        pairs = []
+        for index in range(10):
+            lo, hi = 0x40 + 2 * index, 0x41 + 2 * index
+            registers[lo], registers[hi] = index, 0x100 + index
+            pairs.append((lo, hi))
+        transport = FakeTransport(registers)
+        protocol = ZebraProtocol(transport)  # type: ignore[arg-type]
+
+        values = await protocol.read_registers_32bit(pairs)
+        assert values == [((0x100 + index) << 16) | index for index in range(10)]
+        assert [len(batch) for batch in transport.sent] == [16, 4]
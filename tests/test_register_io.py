@@ -0,0 +1,37 @@
+"""Unit tests for Zebra register IO.
+
+Tests cover:
+- Interning of register IO references
+"""
+
+from fastcs.util import ONCE
+
+from fastcs_zebra.register_io import ZebraRegisterIORef
+
+
+class TestZebraRegisterIORef:
+    """Tests for shared register IO references."""
+
+    def test_same_args_share_instance(self):
+        """Test that identical arguments return the same object."""
+        ref = ZebraRegisterIORef.get(0x88, update_period=ONCE)
+        assert ZebraRegisterIORef.get(0x88, update_period=ONCE) is ref
+
+    def test_32bit_args_share_instance(self):
+        """Test that identical 32-bit arguments return the same object."""
+        ref = ZebraRegisterIORef.get(0xF6, is_32bit=True, register_hi=0xF7)
+        assert ZebraRegisterIORef.get(0xF6, is_32bit=True, register_hi=0xF7) is ref
+
+    def test_different_update_period(self):
+        """Test that a different update period returns a different object."""
+        ref = ZebraRegisterIORef.get(0x88, update_period=ONCE)
+        other = ZebraRegisterIORef.get(0x88, update_period=1.0)
+        assert other is not ref
+        assert other.update_period == 1.0
+        assert ref.update_period == ONCE
+
+    def test_different_register(self):
+        """Test that a different register returns a different object."""
+        ref = ZebraRegisterIORef.get(0x88)
+        assert ZebraRegisterIORef.get(0x89) is not ref
+        assert ref.register == 0x88
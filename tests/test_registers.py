@@ -19,14 +19,20 @@ from fastcs_zebra.registers import (
     Register32,
     RegisterType,
     SysBus,
+    decode_sys_stat,
     get_all_registers,
     get_all_registers_32bit,
     get_register,
     get_register_32bit,
+    get_register_by_address,
+    get_register_by_name,
     is_command_register,
     is_mux_register,
     is_readonly_register,
+    mux_write_pair,
     signal_index_to_name,
+    signal_indices_to_names,
+    signal_name_to_index,
 )
 
 # =============================================================================
@@ -150,6 +156,43 @@ class TestSystemBusSignals:
         with pytest.raises(ValueError, match="Signal index must be 0-63"):
             signal_index_to_name(64)
 
+    def test_signal_indices_to_names(self):
+        """Test converting several indices to names at once."""
+        names = signal_indices_to_names([63, 0, 32])
+        assert names == ["SOFT_IN4", "DISCONNECT", "AND1"]
+        assert signal_indices_to_names(iter(range(3))) == [
+            "DISCONNECT",
+            "IN1_TTL",
+            "IN1_NIM",
+        ]
+        assert signal_indices_to_names([]) == []
+
+    def test_signal_indices_to_names_invalid(self):
+        """Test that any invalid index raises ValueError."""
+        with pytest.raises(ValueError, match="got -1"):
+            signal_indices_to_names([1, -1, 2])
+        with pytest.raises(ValueError, match="got 64"):
+            signal_indices_to_names([0, 64])
+
+    def test_decode_sys_stat(self):
+        """Test naming the active signals of the status registers."""
+        assert decode_sys_stat(0, 0) == []
+        assert decode_sys_stat(1 << SysBus.PC_GATE, 0) == ["PC_GATE"]
+        assert decode_sys_stat(0b10, 1 << (SysBus.AND1 - 32)) == ["IN1_TTL", "AND1"]
+        assert len(decode_sys_stat(0xFFFFFFFF, 0xFFFFFFFF)) == 64
+
+    def test_signal_name_to_index(self):
+        """Test converting names to indices and back."""
+        assert signal_name_to_index("DISCONNECT") == 0
+        assert signal_name_to_index("AND1") == 32
+        for index in range(64):
+            assert signal_name_to_index(signal_index_to_name(index)) == index
+
+    def test_signal_name_to_index_invalid(self):
+        """Test that unknown names raise KeyError."""
+        with pytest.raises(KeyError, match="Unknown signal name"):
+            signal_name_to_index("NOT_A_SIGNAL")
+
 
 # =============================================================================
 # SysBus Constants Tests
@@ -205,6 +248,14 @@ class TestRegisterLookup:
         """Test that register address lookup dict is populated."""
         assert len(REGISTERS_BY_ADDRESS) > 0
 
+    def test_lookup_dicts_are_read_only(self):
+        """Test that the public lookup mappings cannot be modified."""
+        reg = Register("NEW_REG", 0xFE, RegisterType.RW)
+        with pytest.raises(TypeError):
+            REGISTERS_BY_NAME["NEW_REG"] = reg  # type: ignore[index]
+        with pytest.raises(TypeError):
+            del REGISTERS_BY_ADDRESS[0xF0]  # type: ignore[attr-defined]
+
     def test_get_register_by_name(self):
         """Test getting register by name."""
         reg = get_register("SYS_VER")
@@ -228,6 +279,31 @@ class TestRegisterLookup:
         with pytest.raises(KeyError, match="Unknown register address"):
             get_register(0xFE)  # Unused address
 
+    def test_get_register_by_name_function(self):
+        """Test the name-only lookup function."""
+        assert get_register_by_name("PC_ENC") is get_register("PC_ENC")
+        with pytest.raises(KeyError, match="Unknown register name"):
+            get_register_by_name("INVALID_REG")
+
+    def test_get_register_by_address_function(self):
+        """Test the address-only lookup function."""
+        assert get_register_by_address(0x88) is get_register("PC_ENC")
+        with pytest.raises(KeyError, match="Unknown register address"):
+            get_register_by_address(0xFE)
+        for address in (-1, 0x100):
+            with pytest.raises(KeyError, match="Unknown register address"):
+                get_register_by_address(address)
+
+    def test_get_register_by_address_matches_dict(self):
+        """Test that every address resolves to the same register as the dict."""
+        for address in range(0x100):
+            reg = REGISTERS_BY_ADDRESS.get(address)
+            if reg is None:
+                with pytest.raises(KeyError):
+                    get_register_by_address(address)
+            else:
+                assert get_register_by_address(address) is reg
+
     def test_get_register_32bit_valid(self):
         """Test getting 32-bit register pair by name."""
         reg = get_register_32bit("DIV1_DIV")
@@ -315,6 +391,20 @@ class TestTypeAccessors:
         assert is_command_register(0xF0) is False  # SYS_VER (RO)
         assert is_command_register(0x08) is False  # AND1_INP1 (MUX)
 
+    def test_mux_write_pair(self):
+        """Test resolving a MUX register and signal to an address and value."""
+        assert mux_write_pair("AND1_INP1", "IN1_TTL") == (0x08, SysBus.IN1_TTL)
+        assert mux_write_pair("OUT1_TTL", "PC_GATE") == (0x60, SysBus.PC_GATE)
+
+    def test_mux_write_pair_invalid(self):
+        """Test that bad names and non-MUX registers are rejected."""
+        with pytest.raises(KeyError, match="Unknown register name"):
+            mux_write_pair("NOT_A_REG", "IN1_TTL")
+        with pytest.raises(KeyError, match="Unknown signal name"):
+            mux_write_pair("AND1_INP1", "NOT_A_SIGNAL")
+        with pytest.raises(ValueError, match="not a MUX register"):
+            mux_write_pair("PC_ENC", "IN1_TTL")
+
 
 # =============================================================================
 # Get All Registers Tests
@@ -346,6 +436,17 @@ class TestGetAllRegisters:
         assert all(reg.reg_type == RegisterType.MUX for reg in mux_regs)
         assert len(mux_regs) > 0
 
+    def test_get_all_registers_filtered_returns_copy(self):
+        """Test that modifying a filtered result does not affect later calls."""
+        cmd_regs = get_all_registers(RegisterType.CMD)
+        cmd_regs.clear()
+        assert len(get_all_registers(RegisterType.CMD)) > 0
+
+        ro_regs = get_all_registers_32bit(RegisterType.RO)
+        assert [reg.name for reg in ro_regs] == ["SYS_STAT1", "SYS_STAT2", "PC_NUM_CAP"]
+        ro_regs.clear()
+        assert len(get_all_registers_32bit(RegisterType.RO)) == 3
+
     def test_get_all_registers_32bit_returns_list(self):
         """Test that get_all_registers_32bit returns a list."""
         regs = get_all_registers_32bit()
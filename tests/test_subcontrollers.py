@@ -12,6 +12,7 @@ Tests for the Phase 3 controller hierarchy:
 
 import pytest
 
+from fastcs_zebra.registers import SysBus
 from fastcs_zebra.zebra_controller import ZebraController
 
 
@@ -223,6 +224,18 @@ class TestPulseGenerators:
         value = pulse1.dly.get()
         assert value == 100
 
+    @pytest.mark.asyncio
+    async def test_pulse_out_from_status(self, stub_status):
+        """Test that PULSE1-4 outputs follow their system bus bits."""
+        controller = ZebraController("sim://zebra")
+        stub_status.status = 1 << SysBus.PULSE3.value
+        await controller.on_sys_stat_update()
+        assert controller.pulse3.out.get() is True
+        assert controller.pulse1.out.get() is False
+        stub_status.status = 0
+        await controller.on_sys_stat_update()
+        assert controller.pulse3.out.get() is False
+
 
 # =============================================================================
 # Divider Tests
@@ -390,6 +403,17 @@ class TestPositionCompare:
         value = pc.gate_start.get()
         assert value == 1000
 
+    @pytest.mark.asyncio
+    async def test_pc_outputs_from_status(self, stub_status):
+        """Test that PC arm/gate/pulse outputs follow system bus bits 29-31."""
+        controller = ZebraController("sim://zebra")
+        stub_status.status = 1 << SysBus.PC_ARM.value | 1 << SysBus.PC_PULSE.value
+        await controller.on_sys_stat_update()
+        pc = controller.pc
+        assert pc.arm_out.get() is True
+        assert pc.gate_out.get() is False
+        assert pc.pulse_out.get() is True
+
 
 # =============================================================================
 # System Status Tests
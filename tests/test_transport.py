@@ -0,0 +1,194 @@
+"""Unit tests for the Zebra serial transport.
+
+Tests cover:
+- Reassembly of lines split across serial reads
+- Routing of responses and interrupt messages to their queues
+- Draining of queued interrupt messages
+- Default and unlimited read timeouts
+- Reader thread shutdown on disconnect
+- Writes that stall without blocking the event loop
+
+The reader thread is driven either by a scripted fake port or by pyserial's
+``loop://`` port, which reads back whatever is written to it.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from fastcs_zebra.transport import ZebraTransport
+
+
+class ScriptedPort:
+    """Serial port stand-in that returns a fixed sequence of reads."""
+
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = deque(chunks)
+        self.drained = threading.Event()  # Set once every chunk has been read
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._chunks[0]) if self._chunks else 0
+
+    def read(self, size: int) -> bytes:
+        if self._chunks:
+            return self._chunks.popleft()
+        self.drained.set()
+        threading.Event().wait(0.01)  # Poll timeout with nothing waiting
+        return b""
+
+
+class SlowPort:
+    """Serial port stand-in whose writes block, as on a stalled port."""
+
+    WRITE_TIME = 0.2
+
+    def __init__(self):
+        self.written: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        time.sleep(self.WRITE_TIME)
+        self.written.append(data)
+        return len(data)
+
+
+async def route_chunks(chunks: list[bytes]) -> ZebraTransport:
+    """Run the reader thread over the given reads and return the transport."""
+    transport = ZebraTransport("/dev/null")
+    port = ScriptedPort(chunks)
+    thread = threading.Thread(
+        target=transport._read_and_route_messages,
+        args=(port, asyncio.get_running_loop()),
+    )
+    thread.start()
+    try:
+        await asyncio.to_thread(port.drained.wait, 1)
+    finally:
+        transport._reader_stop.set()
+        await asyncio.to_thread(thread.join)
+    await asyncio.sleep(0)  # Let routing callbacks from the thread run
+    return transport
+
+
+def drain(queue: asyncio.Queue[str]) -> list[str]:
+    """Remove and return everything in a queue."""
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+@pytest.fixture
+async def loop_transport():
+    """Transport connected to a pyserial loopback port."""
+    transport = ZebraTransport("loop://")
+    await transport.connect()
+    yield transport
+    await transport.disconnect()
+
+
+class TestReaderThread:
+    """Tests for splitting and routing received data."""
+
+    async def test_lines_split_across_reads(self):
+        """Test that a line split over several reads is delivered whole."""
+        transport = await route_chunks([b"R1", b"01234\nW1", b"0OK", b"\n"])
+        assert drain(transport._response_queue) == ["R101234", "W10OK"]
+
+    async def test_partial_line_is_held_back(self):
+        """Test that data without a terminator is not delivered."""
+        transport = await route_chunks([b"R101234\nR11"])
+        assert drain(transport._response_queue) == ["R101234"]
+
+    async def test_mixed_routing(self):
+        """Test that P messages go to the interrupt queue, others to responses."""
+        transport = await route_chunks(
+            [b"PR\r\nR100001\r\nP00000001\n", b"\nW10OK\nPX\n"]
+        )
+        assert drain(transport._response_queue) == ["R100001", "W10OK"]
+        assert drain(transport._interrupt_queue) == ["PR", "P00000001", "PX"]
+
+
+class TestLoopbackTransport:
+    """Tests for a transport connected to a loopback serial port."""
+
+    async def test_response_and_interrupts(self, loop_transport):
+        """Test that echoed commands are routed by their first character."""
+        await loop_transport.write_lines(["PR", "P0001", "PX", "R100001"])
+        assert await loop_transport.read_line() == "R100001"
+        assert await loop_transport.read_interrupts(1) == ["PR", "P0001", "PX"]
+
+    async def test_read_interrupts_drains_queue(self, loop_transport):
+        """Test that every queued interrupt is returned in one call."""
+        messages = ["PR", *(f"P{n:04X}" for n in range(10)), "PX"]
+        await loop_transport.write_lines([*messages, "W10OK"])
+        await loop_transport.read_line()  # Every interrupt is queued by now
+
+        assert await loop_transport.read_interrupts(1) == messages
+        with pytest.raises(TimeoutError):
+            await loop_transport.read_interrupts(0.01)
+
+    async def test_read_interrupt_default_timeout(self, loop_transport):
+        """Test that a timeout of None uses the default, as for responses."""
+        loop_transport.TIMEOUT = 0.01
+        with pytest.raises(TimeoutError):
+            await loop_transport.read_interrupt()
+        with pytest.raises(TimeoutError):
+            await loop_transport.read_interrupts()
+
+    async def test_read_interrupts_without_timeout(self, loop_transport):
+        """Test that math.inf waits beyond the default timeout."""
+        loop_transport.TIMEOUT = 0.01
+        reader = asyncio.create_task(loop_transport.read_interrupts(math.inf))
+        await asyncio.sleep(0.05)
+        assert not reader.done()
+
+        await loop_transport.write_line("PR")
+        assert await asyncio.wait_for(reader, 1) == ["PR"]
+
+    async def test_disconnect_stops_reader_thread(self):
+        """Test that disconnect stops and joins the reader thread."""
+        transport = ZebraTransport("loop://")
+        await transport.connect()
+        thread = transport._reader_thread
+        assert thread is not None and thread.is_alive()
+
+        await transport.disconnect()
+        assert not thread.is_alive()
+        assert transport._reader_thread is None
+        assert not transport.connected
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await transport.read_line()
+
+
+class TestWrites:
+    """Tests for writing to a port that stalls."""
+
+    @pytest.mark.parametrize("lines", [["R10"], ["R10", "R11"]])
+    async def test_slow_write_does_not_block_loop(self, lines):
+        """Test that the event loop keeps running while a write blocks."""
+        transport = ZebraTransport("/dev/null")
+        port = SlowPort()
+        transport._serial = port  # type: ignore[assignment]
+        transport._connected = True
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        try:
+            if len(lines) == 1:
+                await transport.write_line(lines[0])
+            else:
+                await transport.write_lines(lines)
+        finally:
+            ticker.cancel()
+
+        assert ticks >= 5  # Most of WRITE_TIME was spent running other tasks
+        assert port.written == ["".join(f"{line}\n" for line in lines).encode()]